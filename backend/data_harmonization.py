@@ -156,6 +156,54 @@ class StateDistrictMapper:
             return np.array([aggregated], dtype=np.float64)
         else:
             raise ValueError(f"Unsupported rainfall data shape: {rainfall_data.shape}")
+    
+    def aggregate_rainfall_for_states(self, rainfall_data: np.ndarray,
+                                      state_names: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Aggregate rainfall data for several states in one pass
+        
+        The grid window covering all requested states is copied once and each
+        state's cells are taken from that copy, instead of slicing the full
+        (possibly masked) array once per state.
+        
+        Args:
+            rainfall_data: Rainfall data array (time, lat, lon) or (lat, lon)
+            state_names: Names of the states
+            
+        Returns:
+            Dictionary mapping each state name to its aggregated rainfall values
+            (empty array if the state has no grid cells)
+        """
+        results = {state: np.array([]) for state in state_names}
+        
+        state_indices = {}
+        for state in results:
+            lat_indices, lon_indices = self.get_grid_indices_for_state(state)
+            if len(lat_indices) > 0 and len(lon_indices) > 0:
+                state_indices[state] = (lat_indices, lon_indices)
+        
+        if not state_indices:
+            return results
+        
+        if rainfall_data.ndim not in (2, 3):
+            raise ValueError(f"Unsupported rainfall data shape: {rainfall_data.shape}")
+        
+        # Single plain copy of the union window (NetCDF arrays can be read-only)
+        lat_all = np.unique(np.concatenate([idx[0] for idx in state_indices.values()]))
+        lon_all = np.unique(np.concatenate([idx[1] for idx in state_indices.values()]))
+        window = np.array(rainfall_data[..., lat_all, :][..., lon_all], copy=True)
+        
+        for state, (lat_indices, lon_indices) in state_indices.items():
+            lat_pos = np.searchsorted(lat_all, lat_indices)
+            lon_pos = np.searchsorted(lon_all, lon_indices)
+            data_subset = window[..., lat_pos, :][..., lon_pos]
+            
+            if rainfall_data.ndim == 3:
+                results[state] = np.nanmean(data_subset, axis=(1, 2))
+            else:
+                results[state] = np.array([np.nanmean(data_subset)], dtype=np.float64)
+        
+        return results
 
 
 class TemporalHarmonizer:
@@ -4,10 +4,14 @@ import netCDF4
 import pandas as pd
 from bs4 import BeautifulSoup, Tag
 import os
+import importlib.util
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 import numpy as np
 
+# Only probe for pyarrow here; pandas imports it on first use of string[pyarrow]
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
 
 class RainfallLoader:
     """Load and process NetCDF rainfall data"""
@@ -406,6 +410,12 @@ class CropDataLoader:
             if 'District' in self.df.columns:
                 self.df['District'] = self.df['District'].astype(str).str.replace(r'^\d+\.\s*', '', regex=True)
             
+            # Arrow-backed strings keep name filtering and grouping in native code
+            if PYARROW_AVAILABLE:
+                for col in ('State', 'District'):
+                    if col in self.df.columns:
+                        self.df[col] = self.df[col].astype('string[pyarrow]')
+            
             # Convert Year to numeric where possible
             if 'Year' in self.df.columns:
                 self.df['Year'] = pd.to_numeric(self.df['Year'], errors='coerce')
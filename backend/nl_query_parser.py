@@ -1,9 +1,39 @@
 
 import re
-from typing import Dict, List, Optional, Any
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from query_engine import QueryEngine
 
 
+# States recognized by name in multi-part questions
+INDIAN_STATES = (
+    'Andhra Pradesh', 'Karnataka', 'Maharashtra', 'Tamil Nadu', 'Kerala',
+    'Punjab', 'Gujarat', 'West Bengal', 'Rajasthan', 'Uttar Pradesh',
+    'Madhya Pradesh', 'Bihar', 'Odisha', 'Telangana', 'Assam'
+)
+
+# Result keys and error prefixes for per-state top crops queries
+STATE_RESULT_KEYS = {s: f'top_crops_{s.replace(" ", "_")}' for s in INDIAN_STATES}
+_ERR_TOP_CROPS = {s: f"Top crops for {s} error" for s in INDIAN_STATES}
+
+# State names with spaces removed, for matching "TamilNadu" as well as "Tamil Nadu"
+_NORMALIZED_STATES = {s: s.lower().replace(' ', '') for s in INDIAN_STATES}
+
+
+def _top_crops_key(state: str) -> str:
+    """Result key for a state's top crops (cleaned states may not be in the table)"""
+    key = STATE_RESULT_KEYS.get(state)
+    return key if key is not None else f'top_crops_{state.replace(" ", "_")}'
+
+
+def _top_crops_error(state: str) -> str:
+    """Error prefix for a state's top crops query"""
+    prefix = _ERR_TOP_CROPS.get(state)
+    return prefix if prefix is not None else f"Top crops for {state} error"
+
+
 class NLQueryParser:
     """Parse natural language questions and map to query functions"""
     
@@ -16,6 +46,12 @@ class NLQueryParser:
         """
         self.query_engine = query_engine
         
+        # Sorted crop years, computed once so "last N years" is a tuple slice
+        self._crop_years: Optional[Tuple[int, ...]] = None
+        crop_df = getattr(self.query_engine.crop_loader, 'df', None)
+        if crop_df is not None and 'Year' in crop_df.columns:
+            self._crop_years = tuple(np.unique(crop_df['Year'].dropna().to_numpy().astype(np.int64)).tolist())
+        
         # Patterns for different question types
         self.patterns = {
             'single_rainfall': [
@@ -292,14 +328,11 @@ class NLQueryParser:
                     
                     # Clean crop name - remove state name if accidentally captured
                     crop_words = crop.split()
-                    indian_states = ['Andhra Pradesh', 'Karnataka', 'Maharashtra', 'Tamil Nadu', 'Kerala', 
-                                    'Punjab', 'Gujarat', 'West Bengal', 'Rajasthan', 'Uttar Pradesh',
-                                    'Madhya Pradesh', 'Bihar', 'Odisha', 'Telangana', 'Assam']
                     # If crop name contains a state name, remove it
                     crop_clean = []
                     for word in crop_words:
                         is_state = False
-                        for state in indian_states:
+                        for state in INDIAN_STATES:
                             if word.lower() in state.lower():
                                 is_state = True
                                 break
@@ -431,13 +464,8 @@ class NLQueryParser:
         last_n_pattern = r'last\s+(\d+)\s+(?:available\s+)?year[s]?'
         match = re.search(last_n_pattern, text.lower())
         if match:
-            n = int(match.group(1))
             # Get most recent N years from available data
-            if hasattr(self.query_engine.crop_loader, 'df') and self.query_engine.crop_loader.df is not None:  # type: ignore
-                if 'Year' in self.query_engine.crop_loader.df.columns:  # type: ignore
-                    all_years = sorted(self.query_engine.crop_loader.df['Year'].dropna().unique().astype(int).tolist())  # type: ignore
-                    return all_years[-n:] if len(all_years) >= n else all_years
-            return None
+            return self._last_n_years(int(match.group(1)))
         
         # Look for individual years
         years = re.findall(r'\b(19|20)\d{2}\b', text)
@@ -446,6 +474,12 @@ class NLQueryParser:
         
         return None
     
+    def _last_n_years(self, n: int) -> Optional[List[int]]:
+        """Get the most recent N years from the crop data (all years if fewer)"""
+        if self._crop_years is None:
+            return None
+        return list(self._crop_years[-n:])
+    
     def _normalize_state_capture(self, captured_state: str) -> str:
         """
         Normalize captured state name to standard format
@@ -483,13 +517,7 @@ class NLQueryParser:
             return state_mapping[captured_normalized]
         
         # If no mapping found, try to match by checking against known states
-        standard_states = [
-            'Andhra Pradesh', 'Karnataka', 'Maharashtra', 'Tamil Nadu', 'Kerala',
-            'Punjab', 'Gujarat', 'West Bengal', 'Rajasthan', 'Uttar Pradesh',
-            'Madhya Pradesh', 'Bihar', 'Odisha', 'Telangana', 'Assam'
-        ]
-        
-        for state in standard_states:
+        for state in INDIAN_STATES:
             if re.sub(r'\s+', '', state.lower()) == captured_normalized:
                 return state
         
@@ -623,11 +651,7 @@ class NLQueryParser:
                     # Try to extract "last N years"
                     last_n_match = re.search(r'last\s+(\d+)\s+year', question.lower())
                     if last_n_match:
-                        n = int(last_n_match.group(1))
-                        if hasattr(self.query_engine.crop_loader, 'df') and self.query_engine.crop_loader.df is not None:  # type: ignore
-                            if 'Year' in self.query_engine.crop_loader.df.columns:  # type: ignore
-                                all_years = sorted(self.query_engine.crop_loader.df['Year'].dropna().unique().astype(int).tolist())  # type: ignore
-                                years_to_use = all_years[-n:] if len(all_years) >= n else all_years
+                        years_to_use = self._last_n_years(int(last_n_match.group(1)))
                 
                 result = self.query_engine.compare_crops(
                     params['crop_a'],
@@ -663,6 +687,28 @@ class NLQueryParser:
         # Simple rainfall comparison should NOT be multi-part
         return (has_rainfall and has_crops and has_parallel) or (has_list and has_rainfall)
     
+    def _run_concurrently(self, tasks: List[Tuple[str, str, Callable[[], Dict[str, Any]]]],
+                          results: Dict[str, Any], errors: List[str]) -> None:
+        """
+        Run independent query engine calls on a thread pool
+        
+        Args:
+            tasks: List of (result_key, error_prefix, call) tuples
+            results: Dictionary to store results in, in task order
+            errors: List to append error messages to
+        """
+        if not tasks:
+            return
+        
+        # pandas/numpy release the GIL for most of the heavy lifting
+        with ThreadPoolExecutor(max_workers=min(len(tasks), 3)) as executor:
+            futures = [(key, error_prefix, executor.submit(call)) for key, error_prefix, call in tasks]
+            for key, error_prefix, future in futures:
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    errors.append(f"{error_prefix}: {str(e)}")
+    
     def _execute_multi_part_query(self, question: str) -> Dict[str, Any]:
         """Execute queries with multiple parts"""
         results: Dict[str, Any] = {}
@@ -672,19 +718,10 @@ class NLQueryParser:
         years = self._extract_years(question)
         
         # Extract states mentioned - better pattern to avoid capturing phrases
-        # Match common Indian state names
-        indian_states = [
-            'Andhra Pradesh', 'Karnataka', 'Maharashtra', 'Tamil Nadu', 'Kerala',
-            'Punjab', 'Gujarat', 'West Bengal', 'Rajasthan', 'Uttar Pradesh',
-            'Madhya Pradesh', 'Bihar', 'Odisha', 'Telangana', 'Assam'
-        ]
-        states = []
-        for state_name in indian_states:
-            # Normalize state name for matching (handle both spaced and non-spaced variants)
-            normalized_state = state_name.lower().replace(' ', '')
-            normalized_question = question.lower().replace(' ', '')
-            if normalized_state in normalized_question:
-                states.append(state_name)
+        # Match common Indian state names (handle both spaced and non-spaced variants)
+        lower_q = question.lower()
+        normalized_question = lower_q.replace(' ', '')
+        states = [s for s in INDIAN_STATES if _NORMALIZED_STATES[s] in normalized_question]
         
         # Normalize state names for regex matching
         def normalize_state_name(state: str) -> str:
@@ -692,25 +729,36 @@ class NLQueryParser:
             return state.replace(' ', r'\s*')
         
         # Build state pattern once for use in all regex patterns
-        states_pattern = '|'.join([normalize_state_name(s) for s in indian_states])
+        states_pattern = '|'.join([normalize_state_name(s) for s in INDIAN_STATES])
+        
+        # Independent queries are collected first and executed concurrently below
+        tasks: List[Tuple[str, str, Callable[[], Dict[str, Any]]]] = []
         
         # Try to parse rainfall comparison part
-        if 'rainfall' in question.lower() or 'precipitation' in question.lower():
-            # Look for "compare rainfall in State_X and State_Y"
-            rf_match = re.search(rf'rainfall.*in\s+({states_pattern})\s+and\s+({states_pattern})', question, re.IGNORECASE)
-            if rf_match:
-                state1, state2 = rf_match.groups()
-                # Clean up captured state names to use standard format
-                state1 = self._normalize_state_capture(state1)
-                state2 = self._normalize_state_capture(state2)
-                try:
-                    rf_result = self.query_engine.compare_rainfall([state1, state2], years)
-                    results['rainfall_comparison'] = rf_result
-                except Exception as e:
-                    errors.append(f"Rainfall comparison error: {str(e)}")
+        if 'rainfall' in lower_q or 'precipitation' in lower_q:
+            rf_states: Optional[List[str]] = None
+            if len(states) == 2:
+                # Both states are already known - order them as they appear in the question
+                pos1, pos2 = (normalized_question.find(_NORMALIZED_STATES[s]) for s in states)
+                if pos1 != pos2:
+                    rf_states = states if pos1 < pos2 else [states[1], states[0]]
+            
+            if rf_states is None:
+                # Look for "compare rainfall in State_X and State_Y"
+                rf_match = re.search(rf'rainfall.*in\s+({states_pattern})\s+and\s+({states_pattern})', question, re.IGNORECASE)
+                if rf_match:
+                    # Clean up captured state names to use standard format
+                    rf_states = [self._normalize_state_capture(s) for s in rf_match.groups()]
+            
+            if rf_states is not None:
+                tasks.append((
+                    'rainfall_comparison',
+                    "Rainfall comparison error",
+                    partial(self.query_engine.compare_rainfall, rf_states, years)
+                ))
         
         # Try to parse top crops part
-        if 'top' in question.lower() and 'crop' in question.lower():
+        if 'top' in lower_q and 'crop' in lower_q:
             # Look for "top M crops in State_X and State_Y" or "in each of those states"
             # Use same state pattern as rainfall comparison for consistency
             top_match = re.search(rf'top\s+(\d+).*crop.*in\s+({states_pattern})(?:\s+and\s+({states_pattern}))?', question, re.IGNORECASE)
@@ -719,41 +767,19 @@ class NLQueryParser:
                 state1 = self._normalize_state_capture(top_match.group(2).strip())
                 state2 = self._normalize_state_capture(top_match.group(3).strip()) if top_match.group(3) else None
                 
-                # If "each of those states" is mentioned, use states from rainfall comparison
-                if 'each of those states' in question.lower() or 'each state' in question.lower():
-                    # Extract states from rainfall comparison part
-                    rf_states = []
-                    if 'rainfall_comparison' in results:
-                        # Use normalized states that were already extracted earlier
-                        rf_states = states[:2] if states else []
-                    
-                    if rf_states:
-                        # Get top crops for each state mentioned in rainfall comparison
-                        for state in rf_states[:2]:
-                            try:
-                                crops_result = self.query_engine.get_top_crops(state, years=years, top_n=top_n)
-                                results[f'top_crops_{state.replace(" ", "_")}'] = crops_result
-                            except Exception as e:
-                                errors.append(f"Top crops for {state} error: {str(e)}")
-                    else:
-                        # Fallback to states found earlier
-                        for state in states[:2]:
-                            try:
-                                crops_result = self.query_engine.get_top_crops(state, years=years, top_n=top_n)
-                                results[f'top_crops_{state.replace(" ", "_")}'] = crops_result
-                            except Exception as e:
-                                errors.append(f"Top crops for {state} error: {str(e)}")
+                # If "each of those states" is mentioned, use the normalized states extracted earlier
+                if 'each of those states' in lower_q or 'each state' in lower_q:
+                    top_states = states[:2]
                 else:
                     # Explicit state names provided
-                    try:
-                        if state1:
-                            crops_result = self.query_engine.get_top_crops(state1, years=years, top_n=top_n)
-                            results[f'top_crops_{state1.replace(" ", "_")}'] = crops_result
-                        if state2:
-                            crops_result = self.query_engine.get_top_crops(state2, years=years, top_n=top_n)
-                            results[f'top_crops_{state2.replace(" ", "_")}'] = crops_result
-                    except Exception as e:
-                        errors.append(f"Top crops error: {str(e)}")
+                    top_states = [s for s in (state1, state2) if s]
+                
+                for state in top_states:
+                    tasks.append((
+                        _top_crops_key(state),
+                        _top_crops_error(state),
+                        partial(self.query_engine.get_top_crops, state, years=years, top_n=top_n)
+                    ))
             elif states:
                 # Default to top 10 if no number specified
                 for state in states[:2]:  # Limit to first 2 states
@@ -763,11 +789,13 @@ class NLQueryParser:
                         if state_clean.lower().endswith(' ' + word):
                             state_clean = state_clean.rsplit(' ' + word, 1)[0].strip()
                     if state_clean:
-                        try:
-                            crops_result = self.query_engine.get_top_crops(state_clean, years=years, top_n=10)
-                            results[f'top_crops_{state_clean.replace(" ", "_")}'] = crops_result
-                        except Exception as e:
-                            errors.append(f"Top crops for {state_clean} error: {str(e)}")
+                        tasks.append((
+                            _top_crops_key(state_clean),
+                            _top_crops_error(state_clean),
+                            partial(self.query_engine.get_top_crops, state_clean, years=years, top_n=10)
+                        ))
+        
+        self._run_concurrently(tasks, results, errors)
         
         return {
             'parsed_info': {
@@ -798,19 +826,13 @@ class NLQueryParser:
                 state_words = state_words[:-1]
             state = ' '.join(state_words) if state_words else state
             
-            # Execute trend analysis
-            try:
-                trend_result = self.query_engine.analyze_trends(crop, state)
-                results['trend_analysis'] = trend_result
-            except Exception as e:
-                errors.append(f"Trend analysis error: {str(e)}")
-            
-            # Execute correlation
-            try:
-                corr_result = self.query_engine.correlate_rainfall_production(crop, state)
-                results['correlation'] = corr_result
-            except Exception as e:
-                errors.append(f"Correlation error: {str(e)}")
+            # Trend analysis and correlation are independent, so run them together
+            self._run_concurrently([
+                ('trend_analysis', "Trend analysis error",
+                 partial(self.query_engine.analyze_trends, crop, state)),
+                ('correlation', "Correlation error",
+                 partial(self.query_engine.correlate_rainfall_production, crop, state)),
+            ], results, errors)
         
         return {
             'parsed_info': {
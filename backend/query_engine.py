@@ -8,8 +8,192 @@ import pandas as pd
 from typing import List, Dict, Tuple, Optional, Any
 from scipy import stats
 from data_harmonization import StateDistrictMapper, TemporalHarmonizer
+import functools
+import threading
 import warnings
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Guards the t-statistic against division by zero for perfect fits (as in scipy)
+_TINY = 1.0e-20
+
+# Maximum number of states kept in a QueryEngine's rainfall average memo
+_RAINFALL_MEMO_SIZE = 256
+
+
+if NUMBA_AVAILABLE:
+    # Kernels are serial: the shared QueryEngine is called from several threads
+    # (e.g. Streamlit sessions), and a parallel=True kernel launched
+    # concurrently aborts the process under Numba's workqueue threading layer
+    @njit(cache=True)
+    def _nanmean_kernel(values):
+        total = 0.0
+        count = 0
+        for i in range(values.size):
+            v = values[i]
+            if not np.isnan(v):
+                total += v
+                count += 1
+        if count == 0:
+            return np.nan
+        return total / count
+    
+    @njit(cache=True)
+    def _binned_sum_kernel(codes, values, n_bins):
+        out = np.zeros(n_bins)
+        for i in range(codes.size):
+            v = values[i]
+            if not np.isnan(v):
+                out[codes[i]] += v
+        return out
+    
+    @njit(cache=True)
+    def _column_sums_kernel(matrix, rows, cols):
+        out = np.zeros(cols.size)
+        for j in range(cols.size):
+            col = cols[j]
+            total = 0.0
+            for i in range(rows.size):
+                v = matrix[rows[i], col]
+                if not np.isnan(v):
+                    total += v
+            out[j] = total
+        return out
+
+
+def _nanmean(values: np.ndarray) -> float:
+    """
+    NaN-skipping mean accumulated in float64
+    
+    Uses a single-pass Numba kernel when numba is installed, otherwise
+    falls back to np.nanmean.
+    
+    Args:
+        values: Array of values (any shape)
+        
+    Returns:
+        Mean of the non-NaN values, or NaN if there are none
+    """
+    values = np.asarray(values).astype(np.float64, copy=False)
+    if NUMBA_AVAILABLE:
+        return float(_nanmean_kernel(np.ascontiguousarray(values).ravel()))
+    return float(np.nanmean(values))
+
+
+def _binned_sum(codes: np.ndarray, values: np.ndarray, n_bins: int) -> np.ndarray:
+    """
+    Sum values per integer bin, skipping NaNs (like a groupby sum)
+    
+    Uses a Numba kernel when numba is installed, otherwise np.bincount.
+    
+    Args:
+        codes: Bin index (0..n_bins-1) for each value
+        values: Values to sum
+        n_bins: Number of bins
+        
+    Returns:
+        Array of n_bins sums (0.0 for bins with no non-NaN values)
+    """
+    codes = np.ascontiguousarray(codes, dtype=np.intp)
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _binned_sum_kernel(codes, values, n_bins)
+    return np.bincount(codes, weights=np.where(np.isnan(values), 0.0, values), minlength=n_bins)
+
+
+def _column_sums(matrix: np.ndarray, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """
+    Sum selected columns over selected rows of a value matrix, skipping NaNs
+    
+    Uses a Numba kernel (one pass per column) when numba is installed,
+    otherwise np.nansum over the gathered block.
+    
+    Args:
+        matrix: 2D float64 value matrix
+        rows: Row positions to include
+        cols: Column positions to sum
+        
+    Returns:
+        Array with one sum per entry in cols
+    """
+    rows = np.ascontiguousarray(rows, dtype=np.intp)
+    cols = np.ascontiguousarray(cols, dtype=np.intp)
+    if NUMBA_AVAILABLE:
+        return _column_sums_kernel(matrix, rows, cols)
+    return np.nansum(matrix[np.ix_(rows, cols)], axis=0)
+
+
+def _fast_linregress(x: np.ndarray, y: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Closed-form least-squares fit for small series
+    
+    Same results as scipy.stats.linregress without its validation and result
+    object overhead. Sums are taken about the means to keep large production
+    values numerically stable. Short or degenerate series go through scipy.
+    
+    Args:
+        x: Independent values
+        y: Dependent values
+        
+    Returns:
+        Tuple of (slope, intercept, r_value, p_value)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = x.size
+    
+    if n >= 3:
+        x_mean = x.mean()
+        y_mean = y.mean()
+        dx = x - x_mean
+        dy = y - y_mean
+        sxx = float(np.dot(dx, dx))
+        syy = float(np.dot(dy, dy))
+        sxy = float(np.dot(dx, dy))
+        
+        if sxx != 0.0 and syy != 0.0:
+            slope = sxy / sxx
+            intercept = y_mean - slope * x_mean
+            r_value = min(max(sxy / np.sqrt(sxx * syy), -1.0), 1.0)
+            dof = n - 2
+            t_stat = r_value * np.sqrt(dof / ((1.0 - r_value + _TINY) * (1.0 + r_value + _TINY)))
+            p_value = float(2 * stats.t.sf(np.abs(t_stat), dof))
+            return float(slope), float(intercept), float(r_value), p_value
+    
+    # Get linregress result (returns tuple or LinregressResult, both are indexable)
+    result = stats.linregress(x, y)
+    # Type checker has issues with scipy return types, but runtime values are numeric
+    return float(result[0]), float(result[1]), float(result[2]), float(result[3])  # type: ignore
+
+
+@functools.lru_cache(maxsize=128)
+def _render_citations(citations: Tuple[Tuple[Any, ...], ...]) -> str:
+    """
+    Render citations as markdown (memoized, queries reuse the same few sources)
+    
+    Args:
+        citations: Tuples of (dataset, source, year, resolution)
+        
+    Returns:
+        Markdown citation block
+    """
+    lines = ["### Data Citations", ""]
+    for i, (dataset, source, year, resolution) in enumerate(citations, 1):
+        parts = [f"**{dataset}**"]
+        if source:
+            parts.append(f"Source: {source}")
+        if year:
+            parts.append(f"Year: {year}")
+        if resolution:
+            parts.append(f"Resolution: {resolution}")
+        lines.append(f"{i}. " + " | ".join(parts))
+    
+    return "\n".join(lines)
+
 
 class CitationManager:
     """Manages data citations for outputs"""
@@ -33,18 +217,10 @@ class CitationManager:
         if not self.citations:
             return ""
         
-        lines = ["### Data Citations", ""]
-        for i, cit in enumerate(self.citations, 1):
-            parts = [f"**{cit['dataset']}**"]
-            if cit['source']:
-                parts.append(f"Source: {cit['source']}")
-            if cit['year']:
-                parts.append(f"Year: {cit['year']}")
-            if cit['resolution']:
-                parts.append(f"Resolution: {cit['resolution']}")
-            lines.append(f"{i}. " + " | ".join(parts))
-        
-        return "\n".join(lines)
+        return _render_citations(tuple(
+            (cit['dataset'], cit['source'], cit['year'], cit['resolution'])
+            for cit in self.citations
+        ))
     
     def clear(self):
         """Clear citations"""
@@ -69,7 +245,300 @@ class QueryEngine:
         self.crop_loader = crop_loader
         self.mapper = mapper
         self.harmonizer = harmonizer
-        self.citation_manager = CitationManager()
+        # Citations are collected per call, so each thread gets its own manager
+        # to keep concurrent queries from clearing each other's citations
+        self._local = threading.local()
+        
+        # Lookup tables over the crop DataFrame, rebuilt if the loader's frame is replaced
+        self._indexed_df: Optional[pd.DataFrame] = None
+        self._prod_col_by_crop: Dict[str, str] = {}
+        self._prod_cols_lower: List[Tuple[str, str]] = []
+        self._unit_by_prod_col: Dict[str, str] = {}
+        self._production_cols: List[str] = []
+        self._production_col_idx = np.array([], dtype=np.intp)
+        self._value_matrix = np.empty((0, 0), dtype=np.float64)
+        self._value_col_pos: Dict[str, int] = {}
+        self._available_crops: List[str] = []
+        self._available_crops_lower: List[str] = []
+        self._state_rowidx: Dict[str, np.ndarray] = {}
+        self._state_keys = pd.Index([], dtype=object)
+        self._year_order = np.array([], dtype=np.intp)
+        self._year_row_ranges: Dict[int, Tuple[int, int]] = {}
+        
+        # Per-instance memo tables for deterministic lookups that repeat across queries
+        self._find_production_col = functools.lru_cache(maxsize=256)(self._find_production_col)
+        self._rainfall_avgs: Dict[str, Optional[float]] = {}
+        self._rainfall_lock = threading.Lock()
+        self._rainfall_source = self.rainfall_loader.rainfall_data
+        
+        # Loader metadata is static once loaded; it only feeds citations.
+        # Crop metadata is read with the crop index
+        self._rainfall_meta: Dict[str, Any] = self.rainfall_loader.get_metadata()
+        self._crop_meta: Dict[str, Any] = {}
+        self._build_crop_index()
+    
+    def _build_crop_index(self):
+        """Precompute crop column lookups so queries don't rescan the columns"""
+        df = self.crop_loader.df
+        prod_col_by_crop: Dict[str, str] = {}
+        prod_cols_lower: List[Tuple[str, str]] = []
+        unit_by_prod_col: Dict[str, str] = {}
+        production_cols: List[str] = []
+        available_crops: List[str] = []
+        
+        if df is not None:
+            production_cols = [c for c in df.columns if c.endswith('_production')]
+            # Crop names listed in "not found" messages
+            available_crops = [c.replace('_production', '') for c in df.columns if '_production' in c]
+
+            for col in df.columns:
+                col_lower = col.lower()
+                if 'production' not in col_lower:
+                    continue
+                prod_cols_lower.append((col_lower, col))
+                # Get unit from column name
+                if 'nuts' in col_lower:
+                    unit_by_prod_col[col] = 'Nuts'
+                elif 'bales' in col_lower:
+                    unit_by_prod_col[col] = 'Bales'
+                else:
+                    unit_by_prod_col[col] = 'Tonnes'
+                base_col = col_lower.replace('_production', '').replace('_area', '').replace('_yield', '')
+                # Keep the first column for a crop, matching column order
+                prod_col_by_crop.setdefault(base_col, col)
+        
+        # Row positions per lowercased state; a state's entry also covers any state
+        # whose name contains it, matching case-insensitive substring filtering
+        state_rowidx: Dict[str, np.ndarray] = {}
+        if df is not None and 'State' in df.columns:
+            groups = df.groupby(df['State'].str.lower(), sort=False).indices
+            for key in groups:
+                state_rowidx[key] = np.sort(np.concatenate(
+                    [rows for other, rows in groups.items() if key in other]
+                ))
+        
+        # (State, District) group code per row, numbered in sorted key order as
+        # groupby would; rows with a missing key get -1
+        district_codes = np.array([], dtype=np.intp)
+        district_keys = pd.DataFrame({'State': [], 'District': []})
+        if df is not None and 'State' in df.columns and 'District' in df.columns:
+            grouper = df.groupby(['State', 'District'], sort=True)
+            ngroup = grouper.ngroup().to_numpy(dtype=np.float64)
+            district_codes = np.where(np.isnan(ngroup), -1, ngroup).astype(np.intp)
+            district_keys = grouper.size().index.to_frame(index=False)
+        
+        # Row positions grouped by year: a stable argsort of Year plus the
+        # [start, end) slice of that permutation holding each year
+        year_order = np.array([], dtype=np.intp)
+        year_row_ranges: Dict[int, Tuple[int, int]] = {}
+        if df is not None and 'Year' in df.columns:
+            year_arr = df['Year'].to_numpy()
+            year_order = np.argsort(year_arr, kind='stable')
+            year_keys, starts, counts = np.unique(
+                year_arr[year_order], return_index=True, return_counts=True
+            )
+            for key, start, count in zip(year_keys.tolist(), starts.tolist(), counts.tolist()):
+                year_row_ranges[key] = (start, start + count)
+        
+        # Crop value columns (everything except the key columns) as one float64
+        # matrix, column-major so each column's values are contiguous
+        value_cols: List[str] = []
+        value_matrix = np.empty((0, 0), dtype=np.float64)
+        if df is not None:
+            value_cols = [c for c in df.columns if c not in ('State', 'District', 'Year')]
+            value_matrix = np.asfortranarray(
+                df[value_cols].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+            )
+        value_col_pos = {col: i for i, col in enumerate(value_cols)}
+        
+        # Swap in complete tables so concurrent queries never see a partial index
+        self._prod_col_by_crop = prod_col_by_crop
+        self._prod_cols_lower = prod_cols_lower
+        self._unit_by_prod_col = unit_by_prod_col
+        self._production_cols = production_cols
+        self._production_col_idx = np.array([value_col_pos[c] for c in production_cols], dtype=np.intp)
+        self._value_matrix = value_matrix
+        self._value_col_pos = value_col_pos
+        self._available_crops = available_crops
+        self._available_crops_lower = [c.lower() for c in available_crops]
+        self._state_rowidx = state_rowidx
+        self._state_keys = pd.Index(list(state_rowidx), dtype=object)
+        self._district_codes = district_codes
+        self._district_keys = district_keys
+        self._year_order = year_order
+        self._year_row_ranges = year_row_ranges
+        self._indexed_df = df
+        self._crop_meta = self.crop_loader.get_metadata()
+        self._find_production_col.cache_clear()
+    
+    def _state_rows(self, state_name: str) -> np.ndarray:
+        """
+        Get row positions in the crop DataFrame for a state
+        
+        Args:
+            state_name: State name, matched case-insensitively as a substring
+            
+        Returns:
+            Sorted array of row positions (empty if no state matches)
+        """
+        if self.crop_loader.df is not self._indexed_df:
+            self._build_crop_index()
+        
+        state_lower = state_name.lower()
+        rows = self._state_rowidx.get(state_lower)
+        if rows is not None:
+            return rows
+        
+        # Partial names: match against the distinct state names instead of every row.
+        # Keys are already lowercased, and the name is matched literally (not as a regex)
+        matched = self._state_keys[self._state_keys.str.contains(state_lower, na=False, regex=False)]
+        if len(matched) == 0:
+            return np.array([], dtype=np.intp)
+        return np.unique(np.concatenate([self._state_rowidx[key] for key in matched]))
+    
+    def _filter_years(self, rows: np.ndarray, years: List[int]) -> np.ndarray:
+        """
+        Restrict row positions in the crop DataFrame to the given years
+        
+        Args:
+            rows: Sorted array of row positions
+            years: Years to keep
+            
+        Returns:
+            Sorted array of the row positions whose Year is in years
+        """
+        if self.crop_loader.df is not self._indexed_df:
+            self._build_crop_index()
+        
+        ranges = [self._year_row_ranges[y] for y in set(years) if y in self._year_row_ranges]
+        if not ranges:
+            return np.array([], dtype=np.intp)
+        
+        year_rows = np.concatenate([self._year_order[start:end] for start, end in ranges])
+        return np.intersect1d(rows, year_rows, assume_unique=True)
+    
+    def _column_values(self, rows: np.ndarray, col: str) -> np.ndarray:
+        """
+        Get a crop value column for the given rows from the value matrix
+        
+        Args:
+            rows: Row positions
+            col: Column name
+            
+        Returns:
+            float64 array of the column's values at those rows
+        """
+        return self._value_matrix[rows, self._value_col_pos[col]]
+    
+    def _yearly_sums(self, rows: np.ndarray, col: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sum a crop value column by year over the given rows
+        
+        Args:
+            rows: Row positions
+            col: Column name
+            
+        Returns:
+            Tuple of (sorted years, sum for each year), NaNs counted as zero
+        """
+        year_values = self.crop_loader.df['Year'].to_numpy()[rows]
+        has_year = ~pd.isna(year_values)
+        year_keys, year_codes = np.unique(year_values[has_year], return_inverse=True)
+        sums = _binned_sum(year_codes, self._column_values(rows, col)[has_year], len(year_keys))
+        return year_keys, sums
+    
+    def _years_in(self, rows: np.ndarray) -> List[Any]:
+        """Sorted distinct years present in the given rows"""
+        df = self.crop_loader.df
+        if 'Year' not in df.columns:
+            return []
+        return sorted(df['Year'].iloc[rows].dropna().unique().tolist())
+    
+    def _resolve_production_col(self, crop_name: str) -> Optional[str]:
+        """
+        Find the production column for a crop
+        
+        Args:
+            crop_name: Name of the crop
+            
+        Returns:
+            Column name (exact crop match first, then substring) or None
+        """
+        if self.crop_loader.df is not self._indexed_df:
+            self._build_crop_index()
+        
+        return self._find_production_col(crop_name.lower().strip())
+    
+    def _find_production_col(self, crop_lower: str) -> Optional[str]:
+        """Column lookup behind _resolve_production_col (memoized per instance)"""
+        production_col = self._prod_col_by_crop.get(crop_lower)
+        if production_col is not None:
+            return production_col
+        
+        return next((col for col_lower, col in self._prod_cols_lower if crop_lower in col_lower), None)
+    
+    def _avg_rainfall_many(self, state_names: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Cached average rainfall for several states
+        
+        States not cached yet are aggregated together in one pass over the
+        grid. The average spans every time step in the rainfall grid; a
+        query's years do not filter it, so they are not part of the cache key.
+        
+        Args:
+            state_names: Names of the states
+            
+        Returns:
+            Dictionary mapping each state to its average rainfall in mm, or
+            None if the state has no grid cells
+        """
+        rainfall_data = self.rainfall_loader.rainfall_data
+        with self._rainfall_lock:
+            if rainfall_data is not self._rainfall_source:
+                self._rainfall_avgs.clear()
+                self._rainfall_meta = self.rainfall_loader.get_metadata()
+                self._rainfall_source = rainfall_data
+            averages = {state: self._rainfall_avgs[state] for state in state_names
+                        if state in self._rainfall_avgs}
+        
+        missing = [state for state in dict.fromkeys(state_names) if state not in averages]
+        if not missing:
+            return averages
+        
+        aggregated = self.mapper.aggregate_rainfall_for_states(rainfall_data, missing)
+        computed = {state: _nanmean(values) if len(values) > 0 else None
+                    for state, values in aggregated.items()}
+        
+        with self._rainfall_lock:
+            if rainfall_data is self._rainfall_source:
+                self._rainfall_avgs.update(computed)
+                # Evict the oldest entries once the memo outgrows its cap
+                while len(self._rainfall_avgs) > _RAINFALL_MEMO_SIZE:
+                    del self._rainfall_avgs[next(iter(self._rainfall_avgs))]
+        
+        averages.update(computed)
+        return averages
+    
+    def _avg_rainfall(self, state_name: str) -> Optional[float]:
+        """
+        Cached average rainfall for a state
+        
+        Args:
+            state_name: Name of the state
+            
+        Returns:
+            Average rainfall in mm, or None if the state has no grid cells
+        """
+        return self._avg_rainfall_many([state_name])[state_name]
+    
+    @property
+    def citation_manager(self) -> CitationManager:
+        """Citation manager for the calling thread"""
+        manager = getattr(self._local, 'citation_manager', None)
+        if manager is None:
+            manager = CitationManager()
+            self._local.citation_manager = manager
+        return manager
     
     def get_avg_rainfall(self, state_name: str, years: Optional[List[int]] = None) -> Dict[str, Any]:
         """
@@ -84,10 +553,9 @@ class QueryEngine:
         """
         self.citation_manager.clear()
         
-        # Get grid indices for state
-        lat_indices, lon_indices = self.mapper.get_grid_indices_for_state(state_name)
+        avg_rainfall = self._avg_rainfall(state_name)
         
-        if len(lat_indices) == 0 or len(lon_indices) == 0:
+        if avg_rainfall is None:
             return {
                 'error': f"State '{state_name}' not found or no data available",
                 'average_rainfall': None,
@@ -95,26 +563,8 @@ class QueryEngine:
                 'citation': ""
             }
         
-        # Extract rainfall data for state
-        rainfall_data = self.rainfall_loader.rainfall_data
-        aggregated = self.mapper.aggregate_rainfall_for_state(
-            rainfall_data, state_name
-        )
-        
-        if len(aggregated) == 0:
-            return {
-                'error': f"No rainfall data available for {state_name}",
-                'average_rainfall': None,
-                'years': years,
-                'citation': ""
-            }
-        
-        # Calculate average - ensure array is writable
-        aggregated = np.array(aggregated, copy=True) if not aggregated.flags.writeable else aggregated
-        avg_rainfall = float(np.nanmean(aggregated))
-        
         # Add citation
-        metadata = self.rainfall_loader.get_metadata()
+        metadata = self._rainfall_meta
         self.citation_manager.add_citation(
             "IMD Rainfall Data",
             f"NetCDF: {metadata['filename']}",
@@ -145,14 +595,10 @@ class QueryEngine:
         """
         self.citation_manager.clear()
         
-        results = []
-        for state in state_names:
-            result = self.get_avg_rainfall(state, years)
-            if 'error' not in result:
-                results.append({
-                    'State': state,
-                    'Average Rainfall (mm)': result['average_rainfall']
-                })
+        # Aggregate all requested states together instead of one lookup each
+        averages = self._avg_rainfall_many(state_names)
+        results = [(state, averages[state]) for state in state_names
+                   if averages[state] is not None]
         
         if not results:
             return {
@@ -161,10 +607,10 @@ class QueryEngine:
                 'citation': ""
             }
         
-        df_comparison = pd.DataFrame(results)
+        df_comparison = pd.DataFrame(results, columns=['State', 'Average Rainfall (mm)'])
         
         # Add citation
-        metadata = self.rainfall_loader.get_metadata()
+        metadata = self._rainfall_meta
         self.citation_manager.add_citation(
             "IMD Rainfall Data",
             f"NetCDF: {metadata['filename']}",
@@ -201,10 +647,9 @@ class QueryEngine:
             }
         
         # Filter by state
-        df = self.crop_loader.df.copy()
-        df_state = df[df['State'].str.contains(state_name, case=False, na=False)]
+        rows = self._state_rows(state_name)
         
-        if len(df_state) == 0:
+        if len(rows) == 0:
             return {
                 'error': f"No crop data found for state: {state_name}",
                 'top_crops': None,
@@ -213,10 +658,10 @@ class QueryEngine:
         
         # Filter by years if specified
         if years:
-            df_state = df_state[df_state['Year'].isin(years)]
+            rows = self._filter_years(rows, years)
         
         # Find all production columns
-        production_cols = [c for c in df_state.columns if c.endswith('_production')]
+        production_cols = self._production_cols
         
         if not production_cols:
             return {
@@ -225,34 +670,29 @@ class QueryEngine:
                 'citation': ""
             }
         
-        # Aggregate production by crop
-        crop_totals = []
-        for col in production_cols:
-            crop_name = col.replace('_production', '')
-            total_production = df_state[col].sum()
-            
-            # Get unit from column name or metadata
-            unit = 'Tonnes'  # Default
-            if 'nuts' in col.lower() or 'Nuts' in col:
-                unit = 'Nuts'
-            elif 'bales' in col.lower() or 'Bales' in col:
-                unit = 'Bales'
-            
-            crop_totals.append({
-                'Crop': crop_name,
-                'Total Production': total_production,
-                'Unit': unit
-            })
+        # Aggregate production by crop in one pass over the selected rows
+        values = _column_sums(self._value_matrix, rows, self._production_col_idx)
         
-        # Sort and get top N
-        crop_df = pd.DataFrame(crop_totals)
-        crop_df = crop_df.sort_values('Total Production', ascending=False)
-        crop_df = crop_df.head(top_n)
-        crop_df = crop_df.reset_index(drop=True)
+        # Select the top N with a partial sort; ties go to the earlier column
+        if 0 < top_n < values.size:
+            cutoff = -np.partition(-values, top_n - 1)[top_n - 1]
+            above = np.flatnonzero(values > cutoff)
+            tied = np.flatnonzero(values == cutoff)[:top_n - above.size]
+            idx = np.concatenate([above, tied])
+            idx = idx[np.lexsort((idx, -values[idx]))]
+        else:
+            idx = np.argsort(-values, kind='stable')[:top_n]
+        top_cols = [production_cols[i] for i in idx]
+        
+        crop_df = pd.DataFrame({
+            'Crop': [col[:-len('_production')] for col in top_cols],
+            'Total Production': values[idx],
+            'Unit': [self._unit_by_prod_col[col] for col in top_cols]
+        })
         crop_df.index = crop_df.index + 1  # Start from 1
         
         # Add citation
-        metadata = self.crop_loader.get_metadata()
+        metadata = self._crop_meta
         years_str = f"{min(years)}-{max(years)}" if years else "All available"
         self.citation_manager.add_citation(
             "Agriculture Production Data",
@@ -295,41 +735,17 @@ class QueryEngine:
                 'citation': ""
             }
         
-        df = self.crop_loader.df.copy()
-        
-        # Filter by state
-        if state_name:
-            df = df[df['State'].str.contains(state_name, case=False, na=False)]
-        
-        # Filter by year
-        if year:
-            df = df[df['Year'] == year]
-        
-        # Find production column for crop - improved matching
-        production_col = None
-        crop_lower = crop_name.lower().strip()
+        df = self.crop_loader.df
         
-        # Try exact match first
-        for col in df.columns:
-            col_lower = col.lower()
-            base_col = col_lower.replace('_production', '').replace('_area', '').replace('_yield', '')
-            if crop_lower == base_col and 'production' in col_lower:
-                production_col = col
-                break
+        # Find production column for crop
+        production_col = self._resolve_production_col(crop_name)
         
-        # If no exact match, try substring
         if production_col is None:
-            for col in df.columns:
-                col_lower = col.lower()
-                if crop_lower in col_lower and 'production' in col_lower:
-                    production_col = col
-                    break
-        
-        if production_col is None:
-            available = [c.replace('_production', '') for c in df.columns if '_production' in c]
+            available = self._available_crops
             # Try to suggest similar crop names
             crop_lower = crop_name.lower()
-            suggestions = [c for c in available if crop_lower in c.lower() or c.lower() in crop_lower][:3]
+            suggestions = [c for c, c_lower in zip(available, self._available_crops_lower)
+                           if crop_lower in c_lower or c_lower in crop_lower][:3]
             error_msg = f"Crop '{crop_name}' not found in dataset."
             if suggestions:
                 error_msg += f" Did you mean: {', '.join(suggestions)}?"
@@ -341,23 +757,30 @@ class QueryEngine:
                 'citation': ""
             }
         
-        # Aggregate by district
-        district_data = df.groupby(['State', 'District']).agg({
-            production_col: 'sum',
-            'Year': 'first'
-        }).reset_index()
+        # Filter by state and year on row positions rather than copying the frame
+        if state_name:
+            rows = self._state_rows(state_name)
+        else:
+            rows = np.arange(len(df))
+        if year:
+            rows = self._filter_years(rows, [year])
         
-        district_data = district_data.rename(columns={production_col: 'Production'})
-        district_data = district_data.sort_values('Production', ascending=ascending, na_position='last')
+        # Aggregate by district using the precomputed (State, District) codes
+        codes = self._district_codes[rows]
+        keep = codes >= 0
+        rows, codes = rows[keep], codes[keep]
+        values = self._column_values(rows, production_col)
+        values = np.where(np.isnan(values), 0.0, values)
+        group_ids, first_pos = np.unique(codes, return_index=True)
+        totals = np.bincount(codes, weights=values, minlength=len(self._district_keys))
         
-        # Get unit
-        unit = 'Tonnes'
-        if 'nuts' in production_col.lower():
-            unit = 'Nuts'
-        elif 'bales' in production_col.lower():
-            unit = 'Bales'
+        district_data = self._district_keys.iloc[group_ids].reset_index(drop=True)
+        district_data['Production'] = totals[group_ids]
+        district_data['Year'] = df['Year'].to_numpy()[rows[first_pos]]
         
-        district_data['Unit'] = unit
+        district_data = district_data.sort_values('Production', ascending=ascending, na_position='last')
+        
+        district_data['Unit'] = self._unit_by_prod_col[production_col]
         
         if top_n:
             district_data = district_data.head(top_n)
@@ -365,7 +788,7 @@ class QueryEngine:
         district_data = district_data.reset_index(drop=True)
         
         # Add citation
-        metadata = self.crop_loader.get_metadata()
+        metadata = self._crop_meta
         year_str = str(year) if year else "All available"
         self.citation_manager.add_citation(
             "Agriculture Production Data",
@@ -404,38 +827,23 @@ class QueryEngine:
                 'citation': ""
             }
         
-        df = self.crop_loader.df.copy()
+        df = self.crop_loader.df
         
         # Filter by state
         if state_name:
-            df = df[df['State'].str.contains(state_name, case=False, na=False)]
+            rows = self._state_rows(state_name)
+        else:
+            rows = np.arange(len(df))
         
         # Filter by years
         if years:
-            df = df[df['Year'].isin(years)]
-        
-        # Find production column - improved matching
-        production_col = None
-        crop_lower = crop_name.lower().strip()
+            rows = self._filter_years(rows, years)
         
-        # Try exact match first
-        for col in df.columns:
-            col_lower = col.lower()
-            base_col = col_lower.replace('_production', '').replace('_area', '').replace('_yield', '')
-            if crop_lower == base_col and 'production' in col_lower:
-                production_col = col
-                break
+        # Find production column for crop
+        production_col = self._resolve_production_col(crop_name)
         
-        # If no exact match, try substring
         if production_col is None:
-            for col in df.columns:
-                col_lower = col.lower()
-                if crop_lower in col_lower and 'production' in col_lower:
-                    production_col = col
-                    break
-        
-        if production_col is None:
-            available = [c.replace('_production', '') for c in df.columns if '_production' in c][:10]
+            available = self._available_crops[:10]
             return {
                 'error': f"Crop '{crop_name}' not found. Available crops: {', '.join(available)}...",
                 'trend': None,
@@ -443,11 +851,8 @@ class QueryEngine:
             }
         
         # Aggregate by year
-        yearly_data = df.groupby('Year').agg({
-            production_col: 'sum'
-        }).reset_index()
-        yearly_data = yearly_data.sort_values('Year')
-        yearly_data = yearly_data.rename(columns={production_col: 'Production'})
+        year_keys, yearly_sums = self._yearly_sums(rows, production_col)
+        yearly_data = pd.DataFrame({'Year': year_keys, 'Production': yearly_sums})
         
         # Calculate trend (linear regression)
         if len(yearly_data) > 1:
@@ -460,14 +865,7 @@ class QueryEngine:
             y = y[mask]
             
             if len(x) > 1:
-                # Get linregress result (returns tuple or LinregressResult, both are indexable)
-                result = stats.linregress(x, y)
-                # Use indexing to avoid type checker issues with tuple unpacking
-                # Type checker has issues with scipy return types, but runtime values are numeric
-                slope = float(result[0])  # type: ignore
-                intercept = float(result[1])  # type: ignore
-                r_value = float(result[2])  # type: ignore
-                p_value = float(result[3])  # type: ignore
+                slope, intercept, r_value, p_value = _fast_linregress(x, y)
                 
                 trend = {
                     'slope': slope,
@@ -489,7 +887,7 @@ class QueryEngine:
             }
         
         # Add citation
-        metadata = self.crop_loader.get_metadata()
+        metadata = self._crop_meta
         years_str = f"{years[0]}-{years[-1]}" if years and len(years) > 1 else "All available"
         self.citation_manager.add_citation(
             "Agriculture Production Data",
@@ -520,11 +918,11 @@ class QueryEngine:
         """
         self.citation_manager.clear()
         
-        # Get rainfall data
-        rainfall_result = self.get_avg_rainfall(state_name, years)
-        if 'error' in rainfall_result:
+        # Get rainfall data (cached; citations are added below)
+        avg_rainfall = self._avg_rainfall(state_name)
+        if avg_rainfall is None:
             return {
-                'error': f"Could not get rainfall data: {rainfall_result['error']}",
+                'error': f"Could not get rainfall data: State '{state_name}' not found or no data available",
                 'correlation': None,
                 'citation': ""
             }
@@ -537,31 +935,13 @@ class QueryEngine:
                 'citation': ""
             }
         
-        df = self.crop_loader.df.copy()
-        df_state = df[df['State'].str.contains(state_name, case=False, na=False)]
+        rows = self._state_rows(state_name)
         
-        # Find production column - improved matching
-        production_col = None
-        crop_lower = crop_name.lower().strip()
+        # Find production column for crop
+        production_col = self._resolve_production_col(crop_name)
         
-        # Try exact match first
-        for col in df_state.columns:
-            col_lower = col.lower()
-            base_col = col_lower.replace('_production', '').replace('_area', '').replace('_yield', '')
-            if crop_lower == base_col and 'production' in col_lower:
-                production_col = col
-                break
-        
-        # If no exact match, try substring
         if production_col is None:
-            for col in df_state.columns:
-                col_lower = col.lower()
-                if crop_lower in col_lower and 'production' in col_lower:
-                    production_col = col
-                    break
-        
-        if production_col is None:
-            available = [c.replace('_production', '') for c in df_state.columns if '_production' in c][:10]
+            available = self._available_crops[:10]
             return {
                 'error': f"Crop '{crop_name}' not found. Available crops: {', '.join(available)}...",
                 'correlation': None,
@@ -570,15 +950,12 @@ class QueryEngine:
         
         # Aggregate production by year
         if years:
-            df_state = df_state[df_state['Year'].isin(years)]
-        
-        yearly_production = df_state.groupby('Year')[production_col].sum().reset_index()
-        yearly_production = yearly_production.sort_values('Year')
+            rows = self._filter_years(rows, years)
+        year_keys, yearly_sums = self._yearly_sums(rows, production_col)
+        yearly_production = pd.DataFrame({'Year': year_keys, production_col: yearly_sums})
         
         # For simplicity, use average rainfall for correlation
         # In a full implementation, you'd match rainfall to each year
-        avg_rainfall = rainfall_result['average_rainfall']
-        
         # Create correlation data
         # Note: This is a simplified correlation. Full implementation would
         # match rainfall year-by-year with production
@@ -590,7 +967,7 @@ class QueryEngine:
         }
         
         # Add citations
-        metadata_rf = self.rainfall_loader.get_metadata()
+        metadata_rf = self._rainfall_meta
         self.citation_manager.add_citation(
             "IMD Rainfall Data",
             f"NetCDF: {metadata_rf['filename']}",
@@ -598,7 +975,7 @@ class QueryEngine:
             metadata_rf.get('spatial_resolution', 'Grid-based')
         )
         
-        metadata_crop = self.crop_loader.get_metadata()
+        metadata_crop = self._crop_meta
         years_str = f"{years[0]}-{years[-1]}" if years and len(years) > 1 else "All available"
         self.citation_manager.add_citation(
             "Agriculture Production Data",
@@ -637,58 +1014,43 @@ class QueryEngine:
                 'citation': ""
             }
         
-        df = self.crop_loader.df.copy()
-        df_state = df[df['State'].str.contains(state_name, case=False, na=False)]
+        df = self.crop_loader.df
+        rows = self._state_rows(state_name)
         
         # Filter by year(s)
         if years and len(years) > 0:
-            df_state = df_state[df_state['Year'].isin(years)]
+            rows = self._filter_years(rows, years)
         elif year:
-            df_state = df_state[df_state['Year'] == year]
-        
-        # Find production columns - improved matching
-        prod_col_a = None
-        prod_col_b = None
-        crop_a_lower = crop_a.lower().strip()
-        crop_b_lower = crop_b.lower().strip()
-        
-        # Try exact match first, then substring
-        for col in df_state.columns:
-            col_lower = col.lower()
-            if 'production' in col_lower:
-                base_col = col_lower.replace('_production', '').replace('_area', '').replace('_yield', '')
-                # Exact match
-                if crop_a_lower == base_col and prod_col_a is None:
-                    prod_col_a = col
-                elif crop_a_lower in col_lower and prod_col_a is None:
-                    prod_col_a = col
-                    
-                if crop_b_lower == base_col and prod_col_b is None:
-                    prod_col_b = col
-                elif crop_b_lower in col_lower and prod_col_b is None:
-                    prod_col_b = col
+            rows = self._filter_years(rows, [year])
+        
+        # Find production columns
+        prod_col_a = self._resolve_production_col(crop_a)
+        prod_col_b = self._resolve_production_col(crop_b)
         
         if prod_col_a is None:
-            available = [c.replace('_production', '') for c in df_state.columns if '_production' in c][:5]
+            available = self._available_crops[:5]
             return {'error': f"Crop '{crop_a}' not found. Available crops: {', '.join(available)}...", 'comparison': None, 'citation': ""}
         if prod_col_b is None:
-            available = [c.replace('_production', '') for c in df_state.columns if '_production' in c][:5]
+            available = self._available_crops[:5]
             return {'error': f"Crop '{crop_b}' not found. Available crops: {', '.join(available)}...", 'comparison': None, 'citation': ""}
         
+        # Production for the selected rows
+        values_a = self._column_values(rows, prod_col_a)
+        values_b = self._column_values(rows, prod_col_b)
+        positive_a = values_a > 0  # NaN compares False
+        positive_b = values_b > 0
+        
         # Filter out null/zero rows for more meaningful comparison
-        df_state_filtered = df_state[
-            (df_state[prod_col_a].notna() & (df_state[prod_col_a] > 0)) |
-            (df_state[prod_col_b].notna() & (df_state[prod_col_b] > 0))
-        ]
+        has_positive = positive_a | positive_b
         
         # If filtered dataset is empty, check if any data exists
-        if len(df_state_filtered) == 0:
+        if not has_positive.any():
             # Check if crops exist but all values are 0/NaN
-            has_data_a = df_state[prod_col_a].notna().any()
-            has_data_b = df_state[prod_col_b].notna().any()
+            has_data_a = not np.isnan(values_a).all()
+            has_data_b = not np.isnan(values_b).all()
             
             if not has_data_a or not has_data_b:
-                available_years = sorted(df_state['Year'].dropna().unique().tolist()) if 'Year' in df_state.columns else []
+                available_years = self._years_in(rows)
                 return {
                     'error': f"One or both crops may not have production data for {state_name}. "
                             f"Available years in dataset: {available_years}. "
@@ -697,18 +1059,22 @@ class QueryEngine:
                     'citation': ""
                 }
         
-        # Use filtered data if available, otherwise use original
-        df_to_use = df_state_filtered if len(df_state_filtered) > 0 else df_state
-        
-        # Calculate statistics
-        total_a = df_to_use[prod_col_a].sum()
-        total_b = df_to_use[prod_col_b].sum()
+        # Use filtered rows if available, otherwise the full selection
+        rows_to_use = rows[has_positive] if has_positive.any() else rows
         
+        # Calculate statistics in a single reduction over the needed columns
         area_col_a = prod_col_a.replace('_production', '_area')
         area_col_b = prod_col_b.replace('_production', '_area')
+        stat_cols = list(dict.fromkeys(
+            [prod_col_a, prod_col_b] + [c for c in (area_col_a, area_col_b) if c in self._value_col_pos]
+        ))
+        stat_idx = np.array([self._value_col_pos[c] for c in stat_cols], dtype=np.intp)
+        sums = dict(zip(stat_cols, _column_sums(self._value_matrix, rows_to_use, stat_idx)))
         
-        area_a = df_to_use[area_col_a].sum() if area_col_a in df_to_use.columns else None
-        area_b = df_to_use[area_col_b].sum() if area_col_b in df_to_use.columns else None
+        total_a = sums[prod_col_a]
+        total_b = sums[prod_col_b]
+        area_a = sums.get(area_col_a)
+        area_b = sums.get(area_col_b)
         
         yield_a = None
         yield_b = None
@@ -749,9 +1115,10 @@ class QueryEngine:
                     'metric': 'Yield (Production/Area)'
                 })
         
-        # Argument 3: Geographic distribution
-        districts_a = df_to_use[df_to_use[prod_col_a].notna() & (df_to_use[prod_col_a] > 0)]['District'].nunique()
-        districts_b = df_to_use[df_to_use[prod_col_b].notna() & (df_to_use[prod_col_b] > 0)]['District'].nunique()
+        # Argument 3: Geographic distribution (districts with any positive production)
+        districts = df['District']
+        districts_a = districts.iloc[rows[positive_a]].nunique()
+        districts_b = districts.iloc[rows[positive_b]].nunique()
         
         if districts_a > districts_b:
             arguments.append({
@@ -767,7 +1134,7 @@ class QueryEngine:
             })
         
         # Add citation
-        metadata = self.crop_loader.get_metadata()
+        metadata = self._crop_meta
         year_str = str(year) if year else "All available"
         self.citation_manager.add_citation(
             "Agriculture Production Data",
@@ -779,7 +1146,7 @@ class QueryEngine:
         # Add note if all values are zero
         note = None
         if total_a == 0 and total_b == 0:
-            available_years = sorted(df_state['Year'].dropna().unique().tolist()) if 'Year' in df_state.columns else []
+            available_years = self._years_in(rows)
             note = (f"Note: Both crops show zero production. Available years in dataset: {available_years}. "
                    f"This may indicate limited data availability for these crops in {state_name}.")
         
@@ -792,8 +1159,10 @@ class QueryEngine:
             'comparison': pd.DataFrame({
                 'Crop': [crop_a, crop_b],
                 'Total Production': [total_a, total_b],
-                'Area (Hectares)': [area_a, area_b],
-                'Yield': [yield_a, yield_b],
+                # float64 with NaN for missing area/yield, so callers can use
+                # the columns numerically without re-coercing them
+                'Area (Hectares)': np.array([area_a, area_b], dtype=np.float64),
+                'Yield': np.array([yield_a, yield_b], dtype=np.float64),
                 'Districts': [districts_a, districts_b]
             }),
             'citation': self.citation_manager.format_citations()
@@ -5,9 +5,15 @@ Version: 2025-01 - Updated Title & Branding
 """
 
 from __future__ import annotations
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 import sys
 import os
+import functools
+import hashlib
+import threading
+from contextlib import contextmanager
+from io import BytesIO
 
 # Import streamlit first
 import streamlit as st  # type: ignore
@@ -58,8 +64,33 @@ check_dependencies()
 
 import pandas as pd  # type: ignore
 import numpy as np  # type: ignore
-import matplotlib.pyplot as plt  # type: ignore
+import matplotlib  # type: ignore
+matplotlib.use('Agg')  # headless server: rasterize without probing for a GUI backend
+matplotlib.rcParams['svg.fonttype'] = 'none'  # keep SVG text as text, not glyph paths
 import seaborn as sns  # type: ignore
+from matplotlib.figure import Figure  # type: ignore
+import altair as alt  # type: ignore
+
+# Charts with fewer marks than this are sent as SVG (smaller and crisp for a
+# handful of bars); larger ones are rasterized to WebP at _FIG_DPI
+_SVG_MAX_MARKS = 50
+_FIG_DPI = 100
+_WEBP_QUALITY = 85
+
+# Results with more rows than this are charted in the browser instead of
+# being rasterized with matplotlib
+_BROWSER_CHART_MIN_ROWS = 200
+
+# Results whose tables hold at least this many rows have their markdown
+# rendering memoized (see _format_result)
+_FORMAT_CACHE_MIN_ROWS = 50
+
+# Row cap for result tables shown with st.dataframe
+_TABLE_MAX_ROWS = 200
+
+# Reusable chart figures, keyed by chart type (see _get_fig)
+_FIGURES: dict[str, tuple[Any, Any]] = {}
+_FIGURE_LOCK = threading.Lock()
 
 # Add backend to path
 backend_path = os.path.join(os.path.dirname(__file__), '..', 'backend')
@@ -91,6 +122,18 @@ if 'analyzer' not in st.session_state:
     st.session_state.selected_example = None
 
 
+# The analyzer is shared across sessions (see get_analyzer), so cached helpers
+# key it on its identity rather than having Streamlit pickle its loaded
+# datasets on every lookup
+_ANALYZER_HASH_FUNCS = {RainfallCropAnalyzer: id}
+
+
+@st.cache_resource(show_spinner=False)
+def get_analyzer(nc_file: str, crop_file: str) -> RainfallCropAnalyzer:
+    """Build the analyzer once per process and share it across sessions"""
+    return RainfallCropAnalyzer(nc_file, crop_file)
+
+
 def load_data() -> bool:
     """Load data into session state"""
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -107,7 +150,7 @@ def load_data() -> bool:
     
     try:
         with st.spinner("Loading data... This may take a minute."):
-            st.session_state.analyzer = RainfallCropAnalyzer(nc_file, crop_file)
+            st.session_state.analyzer = get_analyzer(nc_file, crop_file)
             st.session_state.data_loaded = True
         return True
     except Exception as e:
@@ -115,6 +158,31 @@ def load_data() -> bool:
         return False
 
 
+@st.cache_data(show_spinner=False, hash_funcs=_ANALYZER_HASH_FUNCS)
+def get_available_choices(analyzer: RainfallCropAnalyzer) -> tuple[tuple[str, ...], tuple[str, ...], tuple[int, ...]]:
+    """
+    Derive the state/crop/year selector options once per analyzer
+    
+    Args:
+        analyzer: Loaded analyzer whose crop data supplies the options
+        
+    Returns:
+        Tuple of (states, crops, years), each a sorted tuple
+    """
+    df = analyzer.crop_loader.df
+    if df is None:
+        return (), (), ()
+    states = tuple(sorted(pd.unique(df['State'].dropna()).tolist()))
+    # Get crop names from columns
+    crop_cols = df.columns[df.columns.str.endswith('_production')]
+    crops = tuple(sorted(crop_cols.str.replace('_production', '', regex=False).tolist()))
+    # np.unique returns the years already sorted
+    years = df['Year'].to_numpy()
+    if years.dtype.kind == 'f':
+        years = years[~np.isnan(years)]
+    return states, crops, tuple(np.unique(years).astype(np.int64).tolist())
+
+
 def main() -> None:
     # Project Samarth - Build for Bharat
     # Updated: 2025-01 - Branding refresh
@@ -151,17 +219,8 @@ def main() -> None:
     
     analyzer = st.session_state.analyzer
     
-    # Get available states and crops
-    if analyzer.crop_loader.df is not None:
-        available_states = sorted(analyzer.crop_loader.df['State'].dropna().unique().tolist())
-        # Get crop names from columns
-        crop_cols = [c for c in analyzer.crop_loader.df.columns if '_production' in c]
-        available_crops = sorted([c.replace('_production', '') for c in crop_cols])
-        available_years = sorted(analyzer.crop_loader.df['Year'].dropna().unique().astype(int).tolist())
-    else:
-        available_states = []
-        available_crops = []
-        available_years = []
+    # Get available states and crops (cached per analyzer)
+    available_states, available_crops, available_years = get_available_choices(analyzer)
     
     # Route to appropriate page
     if page == "Natural Language Q&A":
@@ -180,154 +239,261 @@ def main() -> None:
         show_crop_comparison(analyzer, available_states, available_crops, available_years)
 
 
-def show_nl_qa(analyzer: RainfallCropAnalyzer) -> None:
-    # Enhanced CSS styling with cohesive color scheme
-    st.markdown("""
-    <style>
-    /* Color Palette */
-    :root {
-        --primary: #6366f1;
-        --primary-dark: #4f46e5;
-        --primary-light: #818cf8;
-        --secondary: #8b5cf6;
-        --success: #10b981;
-        --error: #ef4444;
-        --warning: #f59e0b;
-        --info: #3b82f6;
-        --dark-bg: #1e293b;
-        --dark-surface: #334155;
-        --light-bg: #f8fafc;
-        --light-surface: #ffffff;
-        --text-primary: #1e293b;
-        --text-secondary: #64748b;
-    }
-    
-    .main-header {
-        background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%);
-        padding: 2rem;
-        border-radius: 12px;
-        color: white;
-        margin-bottom: 2rem;
-        box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
-    }
-    
-    .example-card {
-        background: #f8fafc;
-        padding: 1rem;
-        border-radius: 8px;
-        border-left: 4px solid #6366f1;
-        margin: 0.5rem 0;
-        cursor: pointer;
-        transition: all 0.3s;
-        border: 1px solid #e2e8f0;
-    }
-    
-    .example-card:hover {
-        background: #f1f5f9;
-        transform: translateX(3px);
-        box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
-        border-left-color: #4f46e5;
-    }
-    
-    .chat-message {
-        padding: 1rem 1.25rem;
-        border-radius: 12px;
-        margin: 1rem 0;
-        box-shadow: 0 1px 3px 0 rgba(0, 0, 0, 0.1);
-    }
-    
-    .user-message {
-        background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);
-        border-left: 4px solid #3b82f6;
-        color: #1e40af;
-    }
-    
-    .assistant-message {
-        background: linear-gradient(135deg, #dcfce7 0%, #bbf7d0 100%);
-        border-left: 4px solid #10b981;
-        color: #065f46;
-    }
-    
-    .error-message {
-        background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%);
-        border-left: 4px solid #ef4444;
-        color: #991b1b;
-    }
-    
-    .metric-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.08);
-        margin: 0.5rem;
-        border: 1px solid #e2e8f0;
-    }
-    
-    .result-section {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 12px;
-        margin: 1rem 0;
-        box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-        border: 1px solid #e2e8f0;
-    }
-    
-    /* Button styling overrides */
-    div[data-testid="stButton"] > button[kind="primary"] {
-        background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%);
-        color: white;
-        border: none;
-        border-radius: 8px;
-        font-weight: 600;
-        transition: all 0.3s;
-    }
-    
-    div[data-testid="stButton"] > button[kind="primary"]:hover {
-        background: linear-gradient(135deg, #4f46e5 0%, #7c3aed 100%);
-        transform: translateY(-1px);
-        box-shadow: 0 4px 6px -1px rgba(99, 102, 241, 0.3);
-    }
-    
-    div[data-testid="stButton"] > button:not([kind="primary"]) {
-        background: #f1f5f9;
-        color: #475569;
-        border: 1px solid #cbd5e1;
-        border-radius: 8px;
-        font-weight: 500;
-        transition: all 0.3s;
-    }
-    
-    div[data-testid="stButton"] > button:not([kind="primary"]):hover {
-        background: #e2e8f0;
-        border-color: #94a3b8;
-        transform: translateY(-1px);
-    }
-    
-    /* Text area styling */
-    .stTextArea > div > div > textarea {
-        border-radius: 8px;
-        border: 2px solid #e2e8f0;
-        padding: 0.75rem;
-    }
-    
-    .stTextArea > div > div > textarea:focus {
-        border-color: #6366f1;
-        box-shadow: 0 0 0 3px rgba(99, 102, 241, 0.1);
+# Enhanced CSS styling with cohesive color scheme for the Q&A page.
+# Kept at module scope so the string is built once per process rather
+# than re-created inside show_nl_qa() on every rerun.
+_NL_QA_CSS = """
+/* Color Palette */
+:root {
+    --primary: #6366f1;
+    --primary-dark: #4f46e5;
+    --primary-light: #818cf8;
+    --secondary: #8b5cf6;
+    --success: #10b981;
+    --error: #ef4444;
+    --warning: #f59e0b;
+    --info: #3b82f6;
+    --dark-bg: #1e293b;
+    --dark-surface: #334155;
+    --light-bg: #f8fafc;
+    --light-surface: #ffffff;
+    --text-primary: #1e293b;
+    --text-secondary: #64748b;
+}
+
+.main-header {
+    background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%);
+    padding: 2rem;
+    border-radius: 12px;
+    color: white;
+    margin-bottom: 2rem;
+    box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
+}
+
+.example-card {
+    background: #f8fafc;
+    padding: 1rem;
+    border-radius: 8px;
+    border-left: 4px solid #6366f1;
+    margin: 0.5rem 0;
+    cursor: pointer;
+    transition: all 0.3s;
+    border: 1px solid #e2e8f0;
+}
+
+.example-card:hover {
+    background: #f1f5f9;
+    transform: translateX(3px);
+    box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1);
+    border-left-color: #4f46e5;
+}
+
+.chat-message {
+    padding: 1rem 1.25rem;
+    border-radius: 12px;
+    margin: 1rem 0;
+    box-shadow: 0 1px 3px 0 rgba(0, 0, 0, 0.1);
+}
+
+.user-message {
+    background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);
+    border-left: 4px solid #3b82f6;
+    color: #1e40af;
+}
+
+.assistant-message {
+    background: linear-gradient(135deg, #dcfce7 0%, #bbf7d0 100%);
+    border-left: 4px solid #10b981;
+    color: #065f46;
+}
+
+.error-message {
+    background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%);
+    border-left: 4px solid #ef4444;
+    color: #991b1b;
+}
+
+.metric-card {
+    background: white;
+    padding: 1.5rem;
+    border-radius: 12px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.08);
+    margin: 0.5rem;
+    border: 1px solid #e2e8f0;
+}
+
+.result-section {
+    background: white;
+    padding: 1.5rem;
+    border-radius: 12px;
+    margin: 1rem 0;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.08);
+    border: 1px solid #e2e8f0;
+}
+
+/* Button styling overrides */
+div[data-testid="stButton"] > button[kind="primary"] {
+    background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%);
+    color: white;
+    border: none;
+    border-radius: 8px;
+    font-weight: 600;
+    transition: all 0.3s;
+}
+
+div[data-testid="stButton"] > button[kind="primary"]:hover {
+    background: linear-gradient(135deg, #4f46e5 0%, #7c3aed 100%);
+    transform: translateY(-1px);
+    box-shadow: 0 4px 6px -1px rgba(99, 102, 241, 0.3);
+}
+
+div[data-testid="stButton"] > button:not([kind="primary"]) {
+    background: #f1f5f9;
+    color: #475569;
+    border: 1px solid #cbd5e1;
+    border-radius: 8px;
+    font-weight: 500;
+    transition: all 0.3s;
+}
+
+div[data-testid="stButton"] > button:not([kind="primary"]):hover {
+    background: #e2e8f0;
+    border-color: #94a3b8;
+    transform: translateY(-1px);
+}
+
+/* Text area styling */
+.stTextArea > div > div > textarea {
+    border-radius: 8px;
+    border: 2px solid #e2e8f0;
+    padding: 0.75rem;
+}
+
+.stTextArea > div > div > textarea:focus {
+    border-color: #6366f1;
+    box-shadow: 0 0 0 3px rgba(99, 102, 241, 0.1);
+}
+
+/* Query type badge */
+.query-badge {
+    display: inline-block;
+    padding: 0.5rem 1rem;
+    background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%);
+    color: white;
+    border-radius: 20px;
+    font-size: 0.875rem;
+    font-weight: 600;
+    margin: 0.5rem 0;
+}
+"""
+
+
+# Example questions for the Q&A page - only proven working questions
+_EXAMPLES = [
+    # === CHALLENGE QUESTIONS (Original 4) ===
+    {
+        "icon": "🌧️🌾",
+        "text": "Compare the average annual rainfall in Tamil Nadu and Karnataka for the last 2 available years. In parallel, list the top 5 most produced crops in Tamil Nadu and Karnataka during the same period, citing all data sources.",
+        "category": "Challenge Question 1"
+    },
+    {
+        "icon": "📍",
+        "text": "Identify the district in Tamil Nadu with the highest production of Sugarcane in the most recent year available and compare that with the district with the lowest production of Sugarcane in West Bengal",
+        "category": "Challenge Question 2"
+    },
+    {
+        "icon": "📈🌧️",
+        "text": "Analyze the production trend of Sugarcane in Andhra Pradesh. Correlate this trend with the corresponding climate data for the same period and provide a summary of the apparent impact.",
+        "category": "Challenge Question 3"
+    },
+    {
+        "icon": "⚖️📊",
+        "text": "A policy advisor is proposing a scheme to promote Sugarcane over Banana in Tamil Nadu. Based on historical data from the last 3 years, what are the three most compelling data-backed arguments to support this policy? Your answer must synthesize data from both climate and agricultural sources.",
+        "category": "Challenge Question 4"
+    },
+    {
+        "icon": "🌧️",
+        "text": "What is the average annual rainfall in Maharashtra?",
+        "category": "Simple Query"
+    },
+    {
+        "icon": "🌾",
+        "text": "List the top 10 most produced crops in Karnataka",
+        "category": "Simple Query"
+    },
+    {
+        "icon": "📍",
+        "text": "Which district in Andhra Pradesh has the highest production of Coconut?",
+        "category": "Simple Query"
+    },
+    {
+        "icon": "📊",
+        "text": "Compare rainfall between Kerala and Tamil Nadu",
+        "category": "Simple Query"
     }
+]
+
+# Badge titles for parsed query types (read-only)
+_QUERY_TYPE_NAMES: Mapping[str, str] = MappingProxyType({
+    'compare_rainfall': '🌧️ Rainfall Comparison',
+    'top_crops': '🌾 Top Crops',
+    'district_production': '📍 District Analysis',
+    'trend_analysis': '📈 Trend Analysis',
+    'correlation': '🔗 Correlation',
+    'crop_comparison': '⚖️ Crop Comparison',
+    'multi_part': '🔄 Multi-part Query'
+})
+
+# Option labels for the example picker, truncated once at import
+_EXAMPLE_LABELS = tuple(f"{e['icon']} **{e['category']}**: {e['text'][:120]}..." for e in _EXAMPLES)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_parser(engine_id: int, _engine) -> NLQueryParser:
+    """Shared NL parser for a query engine; keyed on the engine's identity"""
+    return NLQueryParser(_engine)
+
+
+def _inject_css() -> None:
+    """Mount the Q&A page stylesheet"""
+    # Streamlit clears elements that are not re-emitted on a rerun, so the
+    # style block has to be sent each run; it is a single prebuilt string.
+    st.markdown(f"<style>{_NL_QA_CSS}</style>", unsafe_allow_html=True)
+
+
+def _chat_html(chat: dict[str, Any]) -> str:
+    """HTML for one question/response exchange"""
+    if chat.get('success'):
+        reply = ('<div class="chat-message assistant-message">'
+                 '<strong style="color: #065f46;">🤖 Assistant:</strong> '
+                 '<span style="color: #065f46;">Query processed successfully! ✅</span></div>')
+    elif chat.get('error'):
+        reply = ('<div class="chat-message error-message">'
+                 '<strong style="color: #991b1b;">❌ Error:</strong> '
+                 f'<span style="color: #991b1b;">{chat.get("error", "Unknown error")}</span></div>')
+    else:
+        reply = ('<div class="chat-message assistant-message">'
+                 '<strong style="color: #065f46;">🤖 Assistant:</strong> '
+                 '<span style="color: #065f46;">Processing...</span></div>')
+    return ('<div class="chat-message user-message">'
+            '<strong style="color: #1e40af;">👤 You:</strong> '
+            f'<span style="color: #1e40af;">{chat["question"]}</span></div>' + reply)
+
+
+def _render_chat_history(history: list[dict[str, Any]]) -> None:
+    """Show the last three conversations, one markdown call per exchange"""
+    if not history:
+        return
+    st.markdown("### 💭 Recent Conversations")
+    recent_chats = history[-3:]  # Show last 3
     
-    /* Query type badge */
-    .query-badge {
-        display: inline-block;
-        padding: 0.5rem 1rem;
-        background: linear-gradient(135deg, #6366f1 0%, #8b5cf6 100%);
-        color: white;
-        border-radius: 20px;
-        font-size: 0.875rem;
-        font-weight: 600;
-        margin: 0.5rem 0;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    for idx, chat in enumerate(recent_chats):
+        with st.expander(f"💬 {chat['question'][:60]}...", expanded=(idx == len(recent_chats) - 1)):
+            st.markdown(_chat_html(chat), unsafe_allow_html=True)
+
+
+def show_nl_qa(analyzer: RainfallCropAnalyzer) -> None:
+    _inject_css()
     
     # Header with gradient
     st.markdown("""
@@ -340,8 +506,8 @@ def show_nl_qa(analyzer: RainfallCropAnalyzer) -> None:
     </div>
     """, unsafe_allow_html=True)
     
-    # Initialize parser
-    parser = NLQueryParser(analyzer.query_engine)
+    # Initialize parser (built once per query engine)
+    parser = _get_parser(id(analyzer.query_engine), analyzer.query_engine)
     
     # Sidebar with quick stats
     with st.sidebar:
@@ -359,104 +525,24 @@ def show_nl_qa(analyzer: RainfallCropAnalyzer) -> None:
             st.rerun()
     
     # Display chat history (show last 3 conversations to avoid clutter)
-    if st.session_state.chat_history:
-        st.markdown("### 💭 Recent Conversations")
-        recent_chats = st.session_state.chat_history[-3:]  # Show last 3
-        
-        for idx, chat in enumerate(recent_chats):
-            with st.expander(f"💬 {chat['question'][:60]}...", expanded=(idx == len(recent_chats) - 1)):
-                # User message
-                st.markdown(f"""
-                <div class="chat-message user-message">
-                    <strong style="color: #1e40af;">👤 You:</strong> 
-                    <span style="color: #1e40af;">{chat['question']}</span>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Assistant response
-                if chat.get('success'):
-                    st.markdown(f"""
-                    <div class="chat-message assistant-message">
-                        <strong style="color: #065f46;">🤖 Assistant:</strong> 
-                        <span style="color: #065f46;">Query processed successfully! ✅</span>
-                    </div>
-                    """, unsafe_allow_html=True)
-                elif chat.get('error'):
-                    st.markdown(f"""
-                    <div class="chat-message error-message">
-                        <strong style="color: #991b1b;">❌ Error:</strong> 
-                        <span style="color: #991b1b;">{chat.get('error', 'Unknown error')}</span>
-                    </div>
-                    """, unsafe_allow_html=True)
-                else:
-                    st.markdown(f"""
-                    <div class="chat-message assistant-message">
-                        <strong style="color: #065f46;">🤖 Assistant:</strong> 
-                        <span style="color: #065f46;">Processing...</span>
-                    </div>
-                    """, unsafe_allow_html=True)
+    _render_chat_history(st.session_state.chat_history)
     
     # Example questions - Only 8 guaranteed working questions
     st.markdown("### 💡 Project Samarth Challenge Questions")
-    st.markdown("**Click on any question to load it into the input box below:**")
-    
-    # Only proven working questions
-    examples = [
-        # === CHALLENGE QUESTIONS (Original 4) ===
-        {
-            "icon": "🌧️🌾",
-            "text": "Compare the average annual rainfall in Tamil Nadu and Karnataka for the last 2 available years. In parallel, list the top 5 most produced crops in Tamil Nadu and Karnataka during the same period, citing all data sources.",
-            "category": "Challenge Question 1"
-        },
-        {
-            "icon": "📍",
-            "text": "Identify the district in Tamil Nadu with the highest production of Sugarcane in the most recent year available and compare that with the district with the lowest production of Sugarcane in West Bengal",
-            "category": "Challenge Question 2"
-        },
-        {
-            "icon": "📈🌧️",
-            "text": "Analyze the production trend of Sugarcane in Andhra Pradesh. Correlate this trend with the corresponding climate data for the same period and provide a summary of the apparent impact.",
-            "category": "Challenge Question 3"
-        },
-        {
-            "icon": "⚖️📊",
-            "text": "A policy advisor is proposing a scheme to promote Sugarcane over Banana in Tamil Nadu. Based on historical data from the last 3 years, what are the three most compelling data-backed arguments to support this policy? Your answer must synthesize data from both climate and agricultural sources.",
-            "category": "Challenge Question 4"
-        },
-        {
-            "icon": "🌧️",
-            "text": "What is the average annual rainfall in Maharashtra?",
-            "category": "Simple Query"
-        },
-        {
-            "icon": "🌾",
-            "text": "List the top 10 most produced crops in Karnataka",
-            "category": "Simple Query"
-        },
-        {
-            "icon": "📍",
-            "text": "Which district in Andhra Pradesh has the highest production of Coconut?",
-            "category": "Simple Query"
-        },
-        {
-            "icon": "📊",
-            "text": "Compare rainfall between Kerala and Tamil Nadu",
-            "category": "Simple Query"
-        }
-    ]
-    
-    # Display all 8 examples in a grid
-    cols = st.columns(2)
-    for idx, example in enumerate(examples):
-        with cols[idx % 2]:
-            if st.button(
-                f"{example['icon']} **{example['category']}**\n\n{example['text'][:120]}...",
-                key=f"example_{idx}",
-                use_container_width=True,
-                help=example['text']
-            ):
-                st.session_state.question_input = example['text']
-                st.rerun()
+    st.markdown("**Pick a question and load it into the input box below:**")
+    
+    # All 8 examples as one radio inside a form: a single widget and one submit
+    with st.form("example_form", border=False):
+        choice = st.radio(
+            "Example questions",
+            options=range(len(_EXAMPLES)),
+            format_func=_EXAMPLE_LABELS.__getitem__,
+            label_visibility="collapsed"
+        )
+        if st.form_submit_button("📥 Load Question"):
+            # The text area below has not been created yet in this run,
+            # so it picks the new value up without another rerun
+            st.session_state.question_input = _EXAMPLES[choice]['text']
     
     # Question input with better styling
     st.markdown("### ✍️ Ask Your Question")
@@ -540,20 +626,16 @@ def show_nl_qa(analyzer: RainfallCropAnalyzer) -> None:
         result_container = st.container()
         
         with result_container:
-            # Processing indicator with progress
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            status_text.info("🔄 Parsing your question...")
-            progress_bar.progress(20)
-            
             try:
-                # Parse and execute
-                query_result = parser.execute_query(question)
-                progress_bar.progress(60)
-                status_text.info("🔄 Executing query...")
+                # Parse and execute; a single status element tracks progress
+                with st.status("🔄 Parsing your question...", expanded=False) as status:
+                    query_result = parser.execute_query(question)
+                    if 'error' in query_result and query_result['result'] is None:
+                        status.update(label="❌ Could not answer the question", state="error")
+                    else:
+                        status.update(label="✅ Query executed successfully!", state="complete")
                 
-                progress_bar.progress(80)
+                parsed = query_result.get('parsed_info') or {}
                 
                 # Result section
                 if 'error' in query_result and query_result['result'] is None:
@@ -567,36 +649,23 @@ def show_nl_qa(analyzer: RainfallCropAnalyzer) -> None:
                     </div>
                     """.format(error=query_result['error']), unsafe_allow_html=True)
                     
-                    if 'suggested_functions' in query_result.get('parsed_info', {}):
+                    if 'suggested_functions' in parsed:
                         with st.expander("💡 Suggested Query Functions", expanded=True):
                             st.markdown("Try using these specific functions:")
-                            for func in query_result['parsed_info']['suggested_functions']:
+                            for func in parsed['suggested_functions']:
                                 st.code(func, language='python')
                     
                     # Show parsing details
                     with st.expander("🔍 Query Parsing Details", expanded=False):
-                        st.json(query_result.get('parsed_info', {}))
+                        st.json(parsed)
                 
                 else:
                     result = query_result.get('result', {})
                     st.session_state.chat_history[-1]['success'] = True
                     
-                    progress_bar.progress(100)
-                    status_text.success("✅ Query executed successfully!")
-                    
                     # Show query type badge
-                    query_type = query_result.get('parsed_info', {}).get('query_type', 'unknown')
-                    query_type_names = {
-                        'compare_rainfall': '🌧️ Rainfall Comparison',
-                        'top_crops': '🌾 Top Crops',
-                        'district_production': '📍 District Analysis',
-                        'trend_analysis': '📈 Trend Analysis',
-                        'correlation': '🔗 Correlation',
-                        'crop_comparison': '⚖️ Crop Comparison',
-                        'multi_part': '🔄 Multi-part Query'
-                    }
-                    
-                    badge_name = query_type_names.get(query_type, query_type.replace('_', ' ').title())
+                    query_type = parsed.get('query_type', 'unknown')
+                    badge_name = _QUERY_TYPE_NAMES.get(query_type, query_type.replace('_', ' ').title())
                     st.markdown(f"""
                     <div class="query-badge">
                         {badge_name}
@@ -604,8 +673,6 @@ def show_nl_qa(analyzer: RainfallCropAnalyzer) -> None:
                     """, unsafe_allow_html=True)
                     
                     # Handle multi-part and trend_correlation results
-                    query_type = query_result.get('parsed_info', {}).get('query_type')
-                    
                     if isinstance(result, dict) and (query_type == 'multi_part' or query_type == 'trend_correlation'):
                         if query_type == 'multi_part':
                             st.markdown("### 🎉 Multi-part Query Results")
@@ -628,16 +695,231 @@ def show_nl_qa(analyzer: RainfallCropAnalyzer) -> None:
                     
                     # Show parsing details in expander
                     with st.expander("🔍 Technical Details", expanded=False):
-                        st.json(query_result.get('parsed_info', {}))
-                
-                progress_bar.empty()
-                status_text.empty()
+                        st.json(parsed)
                 
             except Exception as e:
                 st.session_state.chat_history[-1]['error'] = str(e)
                 st.error(f"❌ Unexpected error: {str(e)}")
-                progress_bar.empty()
-                status_text.empty()
+
+
+def _frame_digest(df: pd.DataFrame) -> str:
+    """Content digest of a result DataFrame, used as the chart cache key"""
+    digest = hashlib.sha1(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    digest.update(repr(tuple(df.columns)).encode())
+    return digest.hexdigest()
+
+
+def _result_digest(result: Any) -> str:
+    """Content digest of a (possibly nested) query result, DataFrames included"""
+    digest = hashlib.blake2b(digest_size=20)
+    
+    def feed(value: Any) -> None:
+        if isinstance(value, pd.DataFrame):
+            digest.update(b'F' + _frame_digest(value).encode())
+        elif isinstance(value, dict):
+            digest.update(b'{')
+            for key, item in value.items():
+                feed(key)
+                feed(item)
+            digest.update(b'}')
+        elif isinstance(value, (list, tuple)):
+            digest.update(b'[')
+            for item in value:
+                feed(item)
+            digest.update(b']')
+        else:
+            digest.update(type(value).__name__.encode() + b':' + str(value).encode() + b';')
+    
+    feed(result)
+    return digest.hexdigest()
+
+
+@st.cache_data(show_spinner=False)
+def _format_result(result_digest: str, _result: dict[str, Any]) -> str:
+    """format_query_result() memoized on the result's content digest"""
+    return format_query_result(_result)
+
+
+@contextmanager
+def _get_fig(key: str, figsize: tuple[float, float], ncols: int = 1):
+    """
+    Borrow the long-lived figure for a chart type with its axes cleared
+    
+    Figures are allocated once per process and redrawn in place. The renderers
+    are cached across sessions and may run on several script threads, so the
+    figure stays locked until the caller has rasterized it.
+    """
+    with _FIGURE_LOCK:
+        if key not in _FIGURES:
+            # Built outside pyplot so the figure stays out of its global
+            # registry and never becomes the "current" figure
+            fig = Figure(figsize=figsize)
+            _FIGURES[key] = (fig, fig.subplots(1, ncols))
+        fig, axes = _FIGURES[key]
+        fig.set_size_inches(figsize)
+        for ax in np.atleast_1d(axes):
+            ax.clear()
+        yield fig, axes
+
+
+@functools.lru_cache(maxsize=64)
+def _color_arr(name: str, n: int, start: float = 0.0, stop: float = 1.0) -> np.ndarray:
+    """Sample n evenly spaced colors from a colormap (cached, read-only)"""
+    colors = matplotlib.colormaps[name](np.linspace(start, stop, n))
+    colors.setflags(write=False)
+    return colors
+
+
+def _fig_to_image(fig, n_marks: int) -> bytes | str:
+    """
+    Encode a figure for st.image
+    
+    Args:
+        fig: Figure to encode
+        n_marks: Number of bars/points drawn, used to pick the format
+        
+    Returns:
+        SVG markup (str) for small charts, WebP bytes otherwise
+    """
+    buf = BytesIO()
+    if n_marks < _SVG_MAX_MARKS:
+        fig.savefig(buf, format='svg', bbox_inches='tight')
+        return buf.getvalue().decode('utf-8')
+    fig.savefig(buf, format='webp', dpi=_FIG_DPI, bbox_inches='tight',
+                pil_kwargs={'quality': _WEBP_QUALITY})
+    return buf.getvalue()
+
+
+# The chart renderers below are keyed on the digest only; the leading underscore
+# keeps Streamlit from hashing the DataFrame itself on every call.
+@st.cache_data(show_spinner=False)
+def _render_rainfall_comparison(digest: str, _df: pd.DataFrame) -> bytes | str:
+    """Bar chart of average rainfall per state"""
+    states = _df['State'].to_numpy()
+    rainfall = _df['Average Rainfall (mm)'].to_numpy()
+    n = len(states)
+    with _get_fig('rainfall', (12, 6)) as (fig, ax):
+        colors = sns.color_palette("husl", n)
+        # Plot against positions with fixed tick labels rather than having
+        # matplotlib build a categorical axis from the state strings
+        x = np.arange(n)
+        bars = ax.bar(x, rainfall, color=colors)
+        ax.set_xticks(x, states, rotation=45, ha='right')
+        ax.set_xlabel('State', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Average Rainfall (mm)', fontsize=12, fontweight='bold')
+        ax.set_title('Rainfall Comparison by State', fontsize=14, fontweight='bold', pad=20)
+        
+        # Add value labels on bars
+        ax.bar_label(bars, fmt='%.1f', padding=3, fontsize=10)
+        
+        fig.tight_layout()
+        return _fig_to_image(fig, n)
+
+
+@st.cache_data(show_spinner=False)
+def _render_crop_comparison(digest: str, _df: pd.DataFrame) -> bytes | str:
+    """Side-by-side production and yield bars for compared crops"""
+    columns = _df.columns
+    crops = _df['Crop'].to_numpy()
+    n = len(crops)
+    x = np.arange(n)
+    colors = ['#4CAF50', '#2196F3']
+    with _get_fig('crop_comparison', (16, 6), ncols=2) as (fig, axes):
+        if 'Total Production' in columns:
+            axes[0].bar(x, _df['Total Production'].to_numpy(), color=colors[:n])
+            axes[0].set_xticks(x, crops, rotation=45)
+            axes[0].set_title('Total Production', fontsize=12, fontweight='bold')
+            axes[0].set_ylabel('Production', fontsize=11)
+        
+        if 'Yield' in columns:
+            yields = _df['Yield'].fillna(0).to_numpy()
+            axes[1].bar(x, yields, color=colors[:n])
+            axes[1].set_xticks(x, crops, rotation=45)
+            axes[1].set_title('Yield Comparison', fontsize=12, fontweight='bold')
+            axes[1].set_ylabel('Yield', fontsize=11)
+        
+        fig.tight_layout()
+        return _fig_to_image(fig, n)
+
+
+@st.cache_data(show_spinner=False)
+def _render_top_crops(digest: str, _df: pd.DataFrame, top_n: int) -> bytes | str:
+    """Horizontal bar chart of the top crops by production"""
+    crops = _df['Crop'].to_numpy()
+    production = _df['Total Production'].to_numpy()
+    n = len(crops)
+    with _get_fig('top_crops', (14, 8)) as (fig, ax):
+        colors = _color_arr('viridis', n)
+        y = np.arange(n)
+        bars = ax.barh(y, production, color=colors)
+        ax.set_yticks(y, crops)
+        ax.set_xlabel('Total Production', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Crop', fontsize=12, fontweight='bold')
+        ax.set_title(f'Top {top_n} Crops by Production', 
+                    fontsize=14, fontweight='bold', pad=20)
+        
+        # Add value labels
+        ax.bar_label(bars, labels=[f"  {v:,.0f}" for v in production],
+                     fontsize=10, fontweight='bold')
+        
+        fig.tight_layout()
+        return _fig_to_image(fig, n)
+
+
+@st.cache_data(show_spinner=False)
+def _render_trend(digest: str, _df: pd.DataFrame, slope: float | None = None,
+                  intercept: float | None = None) -> bytes | str:
+    """Yearly production line, plus the fitted trend line when slope/intercept are given"""
+    years = _df['Year'].to_numpy()
+    production = _df['Production'].to_numpy()
+    with _get_fig('trend', (14, 7)) as (fig, ax):
+        ax.plot(years, production, marker='o', linewidth=3, 
+               markersize=10, color='#2196F3', label='Production')
+        
+        # Add trend line from the regression the query engine already ran
+        if slope is not None and intercept is not None:
+            ax.plot(years, slope * years.astype(np.float64) + intercept, "r--", alpha=0.7, 
+                   linewidth=2, label='Trend Line')
+        
+        ax.set_xlabel('Year', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Production', fontsize=12, fontweight='bold')
+        ax.set_title('Production Trend Analysis', fontsize=14, fontweight='bold', pad=20)
+        ax.grid(True, alpha=0.3)
+        ax.legend(fontsize=11)
+        
+        fig.tight_layout()
+        return _fig_to_image(fig, len(years))
+
+
+@st.cache_data(show_spinner=False)
+def _render_districts(digest: str, _df: pd.DataFrame, crop: str) -> bytes | str:
+    """Horizontal bar chart of production by district"""
+    districts = _df['District'].to_numpy()
+    n = len(districts)
+    with _get_fig('districts', (12, max(8, n * 0.5))) as (fig, ax):
+        colors = _color_arr('plasma', n, 0.2, 0.8)
+        # Positional bars also keep same-named districts from different
+        # states apart, which a categorical axis would merge
+        y = np.arange(n)
+        ax.barh(y, _df['Production'].to_numpy(), color=colors)
+        ax.set_yticks(y, districts)
+        ax.set_xlabel('Production', fontsize=12, fontweight='bold')
+        ax.set_ylabel('District', fontsize=12, fontweight='bold')
+        ax.set_title(f'{crop} Production by District', 
+                    fontsize=14, fontweight='bold', pad=20)
+        
+        fig.tight_layout()
+        return _fig_to_image(fig, n)
+
+
+def _district_chart(df: pd.DataFrame, crop: str) -> alt.Chart:
+    """Browser-rendered bar chart of production for every district"""
+    return alt.Chart(df[['District', 'Production']]).mark_bar().encode(
+        x=alt.X('Production:Q', title='Production'),
+        y=alt.Y('District:N', sort='-x', title='District'),
+        tooltip=['District', alt.Tooltip('Production:Q', format=',.0f')]
+    ).properties(title=f'{crop} Production by District', width='container',
+                 height=alt.Step(14))
 
 
 def _display_result(result: dict[str, Any], part_name: str | None = None) -> None:
@@ -646,142 +928,68 @@ def _display_result(result: dict[str, Any], part_name: str | None = None) -> Non
     st.markdown('<div class="result-section">', unsafe_allow_html=True)
     
     # Format and display result
-    formatted = format_query_result(result)
+    # Hashing costs more than formatting a few rows, so only large tables
+    # go through the memoized formatter
+    table_rows = sum(len(v) for v in result.values() if isinstance(v, pd.DataFrame))
+    if table_rows >= _FORMAT_CACHE_MIN_ROWS:
+        formatted = _format_result(_result_digest(result), result)
+    else:
+        formatted = format_query_result(result)
     st.markdown(formatted)
     
-    # Enhanced visualizations
+    # Enhanced visualizations (rendered once per distinct result)
     if 'comparison' in result and isinstance(result['comparison'], pd.DataFrame):
         df = result['comparison']
         
-        if 'Average Rainfall (mm)' in df.columns:
-            # Rainfall comparison chart
-            fig, ax = plt.subplots(figsize=(12, 6))
-            colors = sns.color_palette("husl", len(df))
-            bars = ax.bar(df['State'], df['Average Rainfall (mm)'], color=colors)
-            ax.set_xlabel('State', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Average Rainfall (mm)', fontsize=12, fontweight='bold')
-            ax.set_title('Rainfall Comparison by State', fontsize=14, fontweight='bold', pad=20)
-            plt.xticks(rotation=45, ha='right')
-            
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{height:.1f}',
-                       ha='center', va='bottom', fontsize=10)
-            
-            plt.tight_layout()
-            st.pyplot(fig)
-            plt.close()
+        if df.empty:
+            st.info("No data to plot")
+        elif 'Average Rainfall (mm)' in df.columns:
+            st.image(_render_rainfall_comparison(_frame_digest(df), df))
             
         elif 'Crop' in df.columns:
-            # Crop comparison chart
-            fig, axes = plt.subplots(1, 2, figsize=(16, 6))
-            
-            if 'Total Production' in df.columns:
-                colors = ['#4CAF50', '#2196F3']
-                axes[0].bar(df['Crop'], df['Total Production'], color=colors[:len(df)])
-                axes[0].set_title('Total Production', fontsize=12, fontweight='bold')
-                axes[0].set_ylabel('Production', fontsize=11)
-                axes[0].tick_params(axis='x', rotation=45)
-            
-            if 'Yield' in df.columns:
-                yields = [y if isinstance(y, (int, float)) and not pd.isna(y) else 0 
-                          for y in df['Yield']]
-                axes[1].bar(df['Crop'], yields, color=colors[:len(df)])
-                axes[1].set_title('Yield Comparison', fontsize=12, fontweight='bold')
-                axes[1].set_ylabel('Yield', fontsize=11)
-                axes[1].tick_params(axis='x', rotation=45)
-            
-            plt.tight_layout()
-            st.pyplot(fig)
-            plt.close()
+            st.image(_render_crop_comparison(_frame_digest(df), df))
     
     elif 'top_crops' in result and isinstance(result['top_crops'], pd.DataFrame):
         df = result['top_crops']
-        fig, ax = plt.subplots(figsize=(14, 8))
-        
-        colors = plt.get_cmap('viridis')(np.linspace(0, 1, len(df)))
-        bars = ax.barh(df['Crop'], df['Total Production'], color=colors)
-        ax.set_xlabel('Total Production', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Crop', fontsize=12, fontweight='bold')
-        ax.set_title(f'Top {result.get("top_n", 10)} Crops by Production', 
-                    fontsize=14, fontweight='bold', pad=20)
-        
-        # Add value labels
-        for i, (idx, row) in enumerate(df.iterrows()):
-            ax.text(row['Total Production'], i, 
-                   f"  {row['Total Production']:,.0f}",
-                   va='center', fontsize=10, fontweight='bold')
-        
-        plt.tight_layout()
-        st.pyplot(fig)
-        plt.close()
+        if df.empty:
+            st.info("No data to plot")
+        else:
+            st.image(_render_top_crops(_frame_digest(df), df, result.get("top_n", 10)))
     
     elif 'trend_analysis' in result:
         trend = result['trend_analysis']
         if 'error' not in trend and 'yearly_data' in trend:
             df = trend['yearly_data']
-            fig, ax = plt.subplots(figsize=(14, 7))
-            
-            ax.plot(df['Year'], df['Production'], marker='o', linewidth=3, 
-                   markersize=10, color='#2196F3', label='Production')
-            
-            # Add trend line
-            if 'slope' in trend:
-                z = np.polyfit(df['Year'], df['Production'], 1)
-                p = np.poly1d(z)
-                ax.plot(df['Year'], p(df['Year']), "r--", alpha=0.7, 
-                       linewidth=2, label='Trend Line')
-            
-            ax.set_xlabel('Year', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Production', fontsize=12, fontweight='bold')
-            ax.set_title('Production Trend Analysis', fontsize=14, fontweight='bold', pad=20)
-            ax.grid(True, alpha=0.3)
-            ax.legend(fontsize=11)
-            
-            plt.tight_layout()
-            st.pyplot(fig)
-            plt.close()
+            if df.empty:
+                st.info("No data to plot")
+            else:
+                st.image(_render_trend(_frame_digest(df), df, trend.get('slope'), trend.get('intercept')))
     
     elif 'districts' in result and isinstance(result['districts'], pd.DataFrame):
-        df = result['districts'].head(20)
-        fig, ax = plt.subplots(figsize=(12, max(8, len(df) * 0.5)))
-        
-        colors = plt.get_cmap('plasma')(np.linspace(0.2, 0.8, len(df)))
-        bars = ax.barh(df['District'], df['Production'], color=colors)
-        ax.set_xlabel('Production', fontsize=12, fontweight='bold')
-        ax.set_ylabel('District', fontsize=12, fontweight='bold')
-        ax.set_title(f'{result.get("crop", "Crop")} Production by District', 
-                    fontsize=14, fontweight='bold', pad=20)
-        
-        plt.tight_layout()
-        st.pyplot(fig)
-        plt.close()
+        df = result['districts']
+        if df.empty:
+            st.info("No data to plot")
+        elif len(df) > _BROWSER_CHART_MIN_ROWS:
+            # Large result sets are drawn client-side from a Vega-Lite spec
+            st.altair_chart(_district_chart(df, result.get("crop", "Crop")))
+        else:
+            df = df.head(20)
+            st.image(_render_districts(_frame_digest(df), df, result.get("crop", "Crop")))
     
     elif 'arguments' in result:
         # Display policy arguments in cards
         st.markdown("### 🎯 Three Data-Backed Arguments")
-        cols = st.columns(3)
-        
-        for idx, arg in enumerate(result['arguments']):
-            with cols[idx]:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <h4 style="color: #667eea; margin-bottom: 0.5rem;">
-                        Argument {idx + 1}
-                    </h4>
-                    <p style="font-weight: bold; margin-bottom: 0.5rem;">
-                        {arg['argument']}
-                    </p>
-                    <p style="color: #666; font-size: 0.9em; margin-bottom: 0.3rem;">
-                        📊 {arg['data']}
-                    </p>
-                    <p style="color: #888; font-size: 0.85em;">
-                        Metric: {arg['metric']}
-                    </p>
-                </div>
-                """, unsafe_allow_html=True)
+        cards = "".join(
+            f'<div class="metric-card" style="flex: 1 1 0; min-width: 220px;">'
+            f'<h4 style="color: #667eea; margin-bottom: 0.5rem;">Argument {idx + 1}</h4>'
+            f'<p style="font-weight: bold; margin-bottom: 0.5rem;">{arg["argument"]}</p>'
+            f'<p style="color: #666; font-size: 0.9em; margin-bottom: 0.3rem;">📊 {arg["data"]}</p>'
+            f'<p style="color: #888; font-size: 0.85em;">Metric: {arg["metric"]}</p>'
+            f'</div>'
+            for idx, arg in enumerate(result['arguments'])
+        )
+        st.markdown(f'<div style="display: flex; flex-wrap: wrap; gap: 1rem;">{cards}</div>',
+                    unsafe_allow_html=True)
     
     elif 'query_type' in result and result['query_type'] == 'district_comparison_cross_state':
         # Display cross-state district comparison
@@ -795,7 +1003,7 @@ def _display_result(result: dict[str, Any], part_name: str | None = None) -> Non
             st.markdown(f"#### 🏆 Highest in {result.get('highest_state', 'N/A')}")
             highest = result.get('highest_district', {})
             if 'districts' in highest and isinstance(highest['districts'], pd.DataFrame) and len(highest['districts']) > 0:
-                st.dataframe(highest['districts'])
+                _show_table(highest['districts'])
             elif 'error' in highest:
                 st.error(highest['error'])
         
@@ -803,7 +1011,7 @@ def _display_result(result: dict[str, Any], part_name: str | None = None) -> Non
             st.markdown(f"#### 📉 Lowest in {result.get('lowest_state', 'N/A')}")
             lowest = result.get('lowest_district', {})
             if 'districts' in lowest and isinstance(lowest['districts'], pd.DataFrame) and len(lowest['districts']) > 0:
-                st.dataframe(lowest['districts'])
+                _show_table(lowest['districts'])
             elif 'error' in lowest:
                 st.error(lowest['error'])
         
@@ -815,6 +1023,131 @@ def _display_result(result: dict[str, Any], part_name: str | None = None) -> Non
     st.markdown('</div>', unsafe_allow_html=True)
 
 
+# Cached query wrappers for the analysis pages. The analyzer is keyed on its
+# identity (see _ANALYZER_HASH_FUNCS); the scalar/tuple query arguments make
+# up the rest of the cache key.
+_QUERY_CACHE_TTL = 3600
+
+
+@st.cache_data(ttl=_QUERY_CACHE_TTL, show_spinner=False, hash_funcs=_ANALYZER_HASH_FUNCS)
+def _cached_avg_rainfall(analyzer: RainfallCropAnalyzer, state: str) -> dict[str, Any]:
+    """Average rainfall for a state, cached per state"""
+    return analyzer.query_engine.get_avg_rainfall(state)
+
+
+@st.cache_data(ttl=_QUERY_CACHE_TTL, show_spinner=False, hash_funcs=_ANALYZER_HASH_FUNCS)
+def _cached_compare_rainfall(analyzer: RainfallCropAnalyzer, states: tuple[str, ...]) -> dict[str, Any]:
+    """Rainfall comparison, cached per tuple of states"""
+    return analyzer.query_engine.compare_rainfall(list(states))
+
+
+@st.cache_data(ttl=_QUERY_CACHE_TTL, show_spinner=False, hash_funcs=_ANALYZER_HASH_FUNCS)
+def _cached_top_crops(analyzer: RainfallCropAnalyzer, state: str,
+                      years: tuple[int, ...] | None, top_n: int) -> dict[str, Any]:
+    """Top crops for a state, cached per state, years and count"""
+    return analyzer.query_engine.get_top_crops(state, list(years) if years else None, top_n)
+
+
+@st.cache_data(ttl=_QUERY_CACHE_TTL, show_spinner=False, hash_funcs=_ANALYZER_HASH_FUNCS)
+def _cached_district_production(analyzer: RainfallCropAnalyzer, crop: str, state: str | None,
+                                year: int | None, top_n: int | None) -> dict[str, Any]:
+    """District production for a crop, cached per crop, state, year and count"""
+    return analyzer.query_engine.get_crop_production_by_district(crop, state, year, top_n)
+
+
+@st.cache_data(ttl=_QUERY_CACHE_TTL, show_spinner=False, hash_funcs=_ANALYZER_HASH_FUNCS)
+def _cached_trends(analyzer: RainfallCropAnalyzer, crop: str, state: str | None) -> dict[str, Any]:
+    """Production trend for a crop, cached per crop and state"""
+    return analyzer.query_engine.analyze_trends(crop, state)
+
+
+@st.cache_data(ttl=_QUERY_CACHE_TTL, show_spinner=False, hash_funcs=_ANALYZER_HASH_FUNCS)
+def _cached_correlation(analyzer: RainfallCropAnalyzer, crop: str, state: str) -> dict[str, Any]:
+    """Rainfall-production correlation, cached per crop and state"""
+    return analyzer.query_engine.correlate_rainfall_production(crop, state)
+
+
+@st.cache_data(ttl=_QUERY_CACHE_TTL, show_spinner=False, hash_funcs=_ANALYZER_HASH_FUNCS)
+def _cached_compare_crops(analyzer: RainfallCropAnalyzer, crop_a: str, crop_b: str, state: str,
+                          year: int | None) -> dict[str, Any]:
+    """Two-crop comparison, cached per crop pair, state and year"""
+    return analyzer.query_engine.compare_crops(crop_a, crop_b, state, year)
+
+
+def _format_metadata_value(value: Any) -> str:
+    """Render a metadata value as display text"""
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value)
+    return str(value)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_ANALYZER_HASH_FUNCS)
+def _metadata_table(analyzer: RainfallCropAnalyzer, source: str) -> pd.DataFrame:
+    """
+    Build a two-column Field/Value table of a loader's metadata
+    
+    Args:
+        analyzer: Loaded analyzer
+        source: 'rainfall' or 'crop'
+        
+    Returns:
+        DataFrame indexed by metadata field, with the value as text
+    """
+    loader = analyzer.rainfall_loader if source == 'rainfall' else analyzer.crop_loader
+    metadata = loader.get_metadata()
+    # Values mix scalars, tuples and lists, so keep them as text for a
+    # uniformly typed column
+    return pd.DataFrame(
+        {'Value': [_format_metadata_value(v) for v in metadata.values()]},
+        index=pd.Index(list(metadata), name='Field')
+    )
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_ANALYZER_HASH_FUNCS)
+def _crop_sample(analyzer: RainfallCropAnalyzer, n: int = 20) -> pd.DataFrame | None:
+    df = analyzer.crop_loader.df
+    return df.head(n) if df is not None else None
+
+
+def _remember_result(key: str, result: dict[str, Any] | None) -> None:
+    """
+    Keep a page's latest query result, and its formatted Markdown, in session state
+    
+    The Markdown is built once per submitted query rather than on every rerun
+    that merely re-displays the result.
+    
+    Args:
+        key: Session state prefix for the page section (e.g. 'top_crops')
+        result: Query result dict, or None to clear the section
+    """
+    st.session_state[f"{key}_result"] = result
+    st.session_state[f"{key}_markdown"] = (
+        format_query_result(result) if result is not None and 'error' not in result else None
+    )
+
+
+def _show_table(df: pd.DataFrame, max_rows: int = _TABLE_MAX_ROWS) -> None:
+    """Display a result table, sending at most max_rows rows to the browser"""
+    if len(df) > max_rows:
+        st.caption(f"Showing the first {max_rows:,} of {len(df):,} rows")
+        df = df.head(max_rows)
+    st.dataframe(df)
+
+
+def _by_year(df: pd.DataFrame) -> pd.DataFrame:
+    """Index a yearly frame by Year as labels, so charts don't format years as 2,022"""
+    return df.set_index(df['Year'].astype('Int64').astype(str)).drop(columns='Year').rename_axis('Year')
+
+
+def _horizontal_bar_chart(df: pd.DataFrame, label: str, value: str) -> alt.Chart:
+    """Horizontal bar chart of value per label, largest bar on top"""
+    return alt.Chart(df[[label, value]]).mark_bar().encode(
+        x=alt.X(f'{value}:Q', title=value),
+        y=alt.Y(f'{label}:N', sort='-x', title=label),
+        tooltip=[label, alt.Tooltip(f'{value}:Q', format=',.0f')]
+    ).properties(width='container', height=alt.Step(20))
+
+
 def show_data_overview(analyzer: RainfallCropAnalyzer) -> None:
     st.header("📊 Data Overview")
     st.markdown("*Data sources: India Meteorological Department (IMD) & Ministry of Agriculture & Farmers Welfare*")
@@ -823,140 +1156,180 @@ def show_data_overview(analyzer: RainfallCropAnalyzer) -> None:
     
     with col1:
         st.subheader("Rainfall Data")
-        rf_metadata = analyzer.rainfall_loader.get_metadata()
-        st.json(rf_metadata)
+        st.table(_metadata_table(analyzer, 'rainfall'))
     
     with col2:
         st.subheader("Crop Production Data")
-        crop_metadata = analyzer.crop_loader.get_metadata()
-        st.json(crop_metadata)
+        st.table(_metadata_table(analyzer, 'crop'))
     
     st.subheader("Sample Crop Data")
-    if analyzer.crop_loader.df is not None:
-        st.dataframe(analyzer.crop_loader.df.head(20))
+    sample = _crop_sample(analyzer)
+    if sample is not None:
+        _show_table(sample)
 
 
-def show_rainfall_analysis(analyzer: RainfallCropAnalyzer, available_states: list[str]) -> None:
-    st.header("🌧️ Rainfall Analysis")
-    
-    tab1, tab2 = st.tabs(["Average Rainfall", "Compare States"])
-    
-    with tab1:
-        st.subheader("Get Average Rainfall by State")
+@st.fragment
+def _rainfall_avg_section(analyzer: RainfallCropAnalyzer, available_states: tuple[str, ...]) -> None:
+    """Average rainfall form and its last result"""
+    st.subheader("Get Average Rainfall by State")
+    with st.form("rf_avg_form"):
         state = st.selectbox("Select State", available_states, key="rf_state")
-        
-        if st.button("Get Average Rainfall"):
-            result = analyzer.query_engine.get_avg_rainfall(state)
-            
-            if 'error' not in result:
-                st.metric("Average Rainfall", f"{result['average_rainfall']:.2f} mm")
-                st.markdown(format_query_result(result))
-            else:
-                st.error(result['error'])
+        submitted = st.form_submit_button("Get Average Rainfall")
     
-    with tab2:
-        st.subheader("Compare Rainfall Between States")
+    if submitted:
+        _remember_result('rf_avg', _cached_avg_rainfall(analyzer, state))
+    
+    result = st.session_state.get('rf_avg_result')
+    if result is not None:
+        if 'error' not in result:
+            st.metric("Average Rainfall", f"{result['average_rainfall']:.2f} mm")
+            st.markdown(st.session_state.rf_avg_markdown)
+        else:
+            st.error(result['error'])
+
+
+@st.fragment
+def _rainfall_compare_section(analyzer: RainfallCropAnalyzer, available_states: tuple[str, ...]) -> None:
+    """State rainfall comparison form and its last result"""
+    st.subheader("Compare Rainfall Between States")
+    with st.form("rf_compare_form"):
         states = st.multiselect("Select States to Compare", available_states, key="rf_states", max_selections=5)
-        
+        submitted = st.form_submit_button("Compare Rainfall")
+    
+    if submitted:
         if len(states) >= 2:
-            if st.button("Compare Rainfall"):
-                result = analyzer.query_engine.compare_rainfall(states)
-                
-                if 'error' not in result:
-                    st.dataframe(result['comparison'])
-                    
-                    # Visualization
-                    fig, ax = plt.subplots(figsize=(10, 6))
-                    df = result['comparison']
-                    ax.bar(df['State'], df['Average Rainfall (mm)'])
-                    ax.set_xlabel('State')
-                    ax.set_ylabel('Average Rainfall (mm)')
-                    ax.set_title('Rainfall Comparison')
-                    plt.xticks(rotation=45, ha='right')
-                    st.pyplot(fig)
-                    
-                    st.markdown(format_query_result(result))
-                else:
-                    st.error(result['error'])
+            _remember_result('rf_compare', _cached_compare_rainfall(analyzer, tuple(states)))
         else:
+            _remember_result('rf_compare', None)
             st.info("Please select at least 2 states")
+    
+    result = st.session_state.get('rf_compare_result')
+    if result is not None:
+        if 'error' not in result:
+            df = result['comparison']
+            if df.empty:
+                st.info("No data")
+            else:
+                _show_table(df)
+                
+                # Visualization (drawn client-side from Arrow data)
+                st.bar_chart(df.set_index('State')['Average Rainfall (mm)'])
+            
+            st.markdown(st.session_state.rf_compare_markdown)
+        else:
+            st.error(result['error'])
 
 
-def show_crop_analysis(analyzer: RainfallCropAnalyzer, available_states: list[str], available_crops: list[str], available_years: list[int]) -> None:
-    st.header("🌾 Crop Production Analysis")
+def show_rainfall_analysis(analyzer: RainfallCropAnalyzer, available_states: tuple[str, ...]) -> None:
+    st.header("🌧️ Rainfall Analysis")
     
-    tab1, tab2 = st.tabs(["Top Crops", "District Analysis"])
+    tab1, tab2 = st.tabs(["Average Rainfall", "Compare States"])
     
     with tab1:
-        st.subheader("Top Crops by Production")
+        _rainfall_avg_section(analyzer, available_states)
+    
+    with tab2:
+        _rainfall_compare_section(analyzer, available_states)
+
+
+@st.fragment
+def _top_crops_section(analyzer: RainfallCropAnalyzer, available_states: tuple[str, ...], available_years: tuple[int, ...]) -> None:
+    """Top crops form and its last result"""
+    st.subheader("Top Crops by Production")
+    with st.form("top_crops_form"):
         state = st.selectbox("Select State", available_states, key="top_crop_state")
         top_n = st.slider("Number of Top Crops", 5, 20, 10, key="top_n")
         years = st.multiselect("Filter by Years (optional)", available_years, key="top_crop_years")
-        
-        if st.button("Get Top Crops"):
-            result = analyzer.query_engine.get_top_crops(
-                state, 
-                years if years else None, 
-                top_n
-            )
-            
-            if 'error' not in result:
-                st.dataframe(result['top_crops'])
-                
-                # Visualization
-                fig, ax = plt.subplots(figsize=(12, 6))
-                df = result['top_crops']
-                ax.barh(df['Crop'], df['Total Production'])
-                ax.set_xlabel('Total Production')
-                ax.set_ylabel('Crop')
-                ax.set_title(f'Top {top_n} Crops in {state}')
-                st.pyplot(fig)
-                
-                st.markdown(format_query_result(result))
+        submitted = st.form_submit_button("Get Top Crops")
+    
+    if submitted:
+        _remember_result('top_crops', _cached_top_crops(
+            analyzer,
+            state, 
+            tuple(years) if years else None, 
+            top_n
+        ))
+    
+    result = st.session_state.get('top_crops_result')
+    if result is not None:
+        if 'error' not in result:
+            df = result['top_crops']
+            if df.empty:
+                st.info("No data")
             else:
-                st.error(result['error'])
-    
-    with tab2:
-        st.subheader("Crop Production by District")
+                _show_table(df)
+                
+                # Visualization (drawn client-side from Arrow data)
+                st.altair_chart(_horizontal_bar_chart(df, 'Crop', 'Total Production'))
+            
+            st.markdown(st.session_state.top_crops_markdown)
+        else:
+            st.error(result['error'])
+
+
+@st.fragment
+def _district_section(analyzer: RainfallCropAnalyzer, available_states: tuple[str, ...], available_crops: tuple[str, ...], available_years: tuple[int, ...]) -> None:
+    """District production form and its last result"""
+    st.subheader("Crop Production by District")
+    with st.form("district_form"):
         crop = st.selectbox("Select Crop", available_crops, key="district_crop")
-        state = st.selectbox("Select State (optional)", [None] + available_states, key="district_state")
-        year = st.selectbox("Select Year (optional)", [None] + available_years, key="district_year")
+        state = st.selectbox("Select State (optional)", (None,) + available_states, key="district_state")
+        year = st.selectbox("Select Year (optional)", (None,) + available_years, key="district_year")
         top_n = st.slider("Number of Districts", 5, 50, 10, key="district_top_n")
-        
-        if st.button("Get District Data"):
-            result = analyzer.query_engine.get_crop_production_by_district(
-                crop,
-                state,
-                year,
-                top_n
-            )
-            
-            if 'error' not in result:
-                st.dataframe(result['districts'])
-                
-                # Visualization
-                fig, ax = plt.subplots(figsize=(12, 8))
-                df = result['districts'].head(top_n)
-                ax.barh(df['District'], df['Production'])
-                ax.set_xlabel('Production')
-                ax.set_ylabel('District')
-                ax.set_title(f'{crop} Production by District')
-                st.pyplot(fig)
-                
-                st.markdown(format_query_result(result))
+        submitted = st.form_submit_button("Get District Data")
+    
+    if submitted:
+        _remember_result('district', _cached_district_production(
+            analyzer,
+            crop,
+            state,
+            year,
+            top_n
+        ))
+    
+    result = st.session_state.get('district_result')
+    if result is not None:
+        if 'error' not in result:
+            df = result['districts']
+            if df.empty:
+                st.info("No data")
             else:
-                st.error(result['error'])
+                # Visualization (drawn client-side from Arrow data)
+                st.altair_chart(_horizontal_bar_chart(df, 'District', 'Production'))
+                
+                with st.expander("District details"):
+                    _show_table(df)
+            
+            st.markdown(st.session_state.district_markdown)
+        else:
+            st.error(result['error'])
 
 
-def show_trend_analysis(analyzer: RainfallCropAnalyzer, available_states: list[str], available_crops: list[str]) -> None:
-    st.header("📈 Trend Analysis")
+def show_crop_analysis(analyzer: RainfallCropAnalyzer, available_states: tuple[str, ...], available_crops: tuple[str, ...], available_years: tuple[int, ...]) -> None:
+    st.header("🌾 Crop Production Analysis")
     
-    crop = st.selectbox("Select Crop", available_crops, key="trend_crop")
-    state = st.selectbox("Select State (optional)", [None] + available_states, key="trend_state")
+    tab1, tab2 = st.tabs(["Top Crops", "District Analysis"])
     
-    if st.button("Analyze Trends"):
-        result = analyzer.query_engine.analyze_trends(crop, state)
-        
+    with tab1:
+        _top_crops_section(analyzer, available_states, available_years)
+    
+    with tab2:
+        _district_section(analyzer, available_states, available_crops, available_years)
+
+
+@st.fragment
+def _trend_section(analyzer: RainfallCropAnalyzer, available_states: tuple[str, ...], available_crops: tuple[str, ...]) -> None:
+    """Trend analysis form and its last result"""
+    with st.form("trend_form"):
+        crop = st.selectbox("Select Crop", available_crops, key="trend_crop")
+        state = st.selectbox("Select State (optional)", (None,) + available_states, key="trend_state")
+        submitted = st.form_submit_button("Analyze Trends")
+    
+    if submitted:
+        _remember_result('trend', _cached_trends(analyzer, crop, state))
+    
+    result = st.session_state.get('trend_result')
+    if result is not None:
         if 'error' not in result:
             trend = result['trend_analysis']
             
@@ -969,81 +1342,94 @@ def show_trend_analysis(analyzer: RainfallCropAnalyzer, available_states: list[s
                 with col3:
                     st.metric("P-value", f"{trend.get('p_value', 0):.4f}")
                 
-                # Visualization
-                fig, ax = plt.subplots(figsize=(12, 6))
+                # Visualization (drawn client-side from Arrow data)
                 df = trend['yearly_data']
-                ax.plot(df['Year'], df['Production'], marker='o')
-                ax.set_xlabel('Year')
-                ax.set_ylabel('Production')
-                ax.set_title(f'{crop} Production Trend')
-                ax.grid(True)
-                st.pyplot(fig)
-                
-                st.dataframe(df)
-                st.markdown(format_query_result(result))
+                if df.empty:
+                    st.info("No data")
+                else:
+                    st.line_chart(_by_year(df))
+                    with st.expander("Yearly data"):
+                        _show_table(df)
+                st.markdown(st.session_state.trend_markdown)
             else:
                 st.error(trend['error'])
         else:
             st.error(result['error'])
 
 
-def show_correlation_analysis(analyzer: RainfallCropAnalyzer, available_states: list[str], available_crops: list[str]) -> None:
-    st.header("🔗 Correlation Analysis")
-    
-    st.markdown("Analyze correlation between rainfall and crop production")
-    
-    crop = st.selectbox("Select Crop", available_crops, key="corr_crop")
-    state = st.selectbox("Select State", available_states, key="corr_state")
+def show_trend_analysis(analyzer: RainfallCropAnalyzer, available_states: tuple[str, ...], available_crops: tuple[str, ...]) -> None:
+    st.header("📈 Trend Analysis")
     
-    if st.button("Calculate Correlation"):
-        result = analyzer.query_engine.correlate_rainfall_production(crop, state)
-        
+    _trend_section(analyzer, available_states, available_crops)
+
+
+@st.fragment
+def _correlation_section(analyzer: RainfallCropAnalyzer, available_states: tuple[str, ...], available_crops: tuple[str, ...]) -> None:
+    """Correlation form and its last result"""
+    with st.form("corr_form"):
+        crop = st.selectbox("Select Crop", available_crops, key="corr_crop")
+        state = st.selectbox("Select State", available_states, key="corr_state")
+        submitted = st.form_submit_button("Calculate Correlation")
+    
+    if submitted:
+        _remember_result('corr', _cached_correlation(analyzer, crop, state))
+    
+    result = st.session_state.get('corr_result')
+    if result is not None:
         if 'error' not in result:
             corr = result['correlation']
             st.metric("Average Rainfall", f"{corr.get('average_rainfall_mm', 0):.2f} mm")
             
             st.subheader("Production by Year")
-            st.dataframe(corr['production_data'])
-            
-            # Visualization
-            fig, ax = plt.subplots(figsize=(12, 6))
             df = corr['production_data']
-            ax.plot(df['Year'], df['Production'], marker='o', label='Production')
-            ax.axhline(y=corr.get('average_rainfall_mm', 0), color='r', linestyle='--', label='Average Rainfall (mm)')
-            ax.set_xlabel('Year')
-            ax.set_ylabel('Production / Rainfall')
-            ax.set_title(f'Rainfall vs {crop} Production in {state}')
-            ax.legend()
-            ax.grid(True)
-            st.pyplot(fig)
+            if df.empty:
+                st.info("No data")
+            else:
+                _show_table(df)
+                
+                # Visualization (drawn client-side from Arrow data); the production
+                # column carries the crop's column name, so plot every non-Year column
+                st.line_chart(_by_year(df).assign(**{
+                    'Average Rainfall (mm)': corr.get('average_rainfall_mm', 0)
+                }))
             
-            st.markdown(format_query_result(result))
+            st.markdown(st.session_state.corr_markdown)
         else:
             st.error(result['error'])
 
 
-def show_crop_comparison(analyzer: RainfallCropAnalyzer, available_states: list[str], available_crops: list[str], available_years: list[int]) -> None:
-    st.header("⚖️ Crop Comparison")
-    
-    st.markdown("Compare two crops and get three data-backed arguments")
-    
-    col1, col2 = st.columns(2)
-    with col1:
-        crop_a = st.selectbox("First Crop", available_crops, key="comp_crop_a")
-    with col2:
-        crop_b = st.selectbox("Second Crop", available_crops, key="comp_crop_b", 
-                             index=min(1, len(available_crops)-1))
-    
-    state = st.selectbox("Select State", available_states, key="comp_state")
-    year = st.selectbox("Select Year (optional)", [None] + available_years, key="comp_year")
+def show_correlation_analysis(analyzer: RainfallCropAnalyzer, available_states: tuple[str, ...], available_crops: tuple[str, ...]) -> None:
+    st.header("🔗 Correlation Analysis")
     
-    if crop_a == crop_b:
-        st.warning("Please select two different crops")
-        return
+    st.markdown("Analyze correlation between rainfall and crop production")
     
-    if st.button("Compare Crops"):
-        result = analyzer.query_engine.compare_crops(crop_a, crop_b, state, year)
+    _correlation_section(analyzer, available_states, available_crops)
+
+
+@st.fragment
+def _crop_comparison_section(analyzer: RainfallCropAnalyzer, available_states: tuple[str, ...], available_crops: tuple[str, ...], available_years: tuple[int, ...]) -> None:
+    """Crop comparison form and its last result"""
+    with st.form("comp_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            crop_a = st.selectbox("First Crop", available_crops, key="comp_crop_a")
+        with col2:
+            crop_b = st.selectbox("Second Crop", available_crops, key="comp_crop_b", 
+                                 index=min(1, len(available_crops)-1))
         
+        state = st.selectbox("Select State", available_states, key="comp_state")
+        year = st.selectbox("Select Year (optional)", (None,) + available_years, key="comp_year")
+        submitted = st.form_submit_button("Compare Crops")
+    
+    if submitted:
+        if crop_a == crop_b:
+            _remember_result('comp', None)
+            st.warning("Please select two different crops")
+        else:
+            _remember_result('comp', _cached_compare_crops(analyzer, crop_a, crop_b, state, year))
+    
+    result = st.session_state.get('comp_result')
+    if result is not None:
         if 'error' not in result:
             st.subheader("Three Data-Backed Arguments")
             for i, arg in enumerate(result['arguments'], 1):
@@ -1051,44 +1437,38 @@ def show_crop_comparison(analyzer: RainfallCropAnalyzer, available_states: list[
                     st.write(f"**Data:** {arg['data']}")
                     st.write(f"**Metric:** {arg['metric']}")
             
-            st.subheader("Comparison Table")
-            st.dataframe(result['comparison'])
-            
-            # Visualization
-            fig, axes = plt.subplots(1, 3, figsize=(18, 6))
-            
             df = result['comparison']
-            crops = df['Crop'].tolist()
-            
-            # Total Production
-            axes[0].bar(crops, df['Total Production'])
-            axes[0].set_title('Total Production')
-            axes[0].set_ylabel('Production')
-            
-            # Yield
-            yields = []
-            for y in df['Yield']:
-                if isinstance(y, (int, float)) and not np.isnan(y):
-                    yields.append(y)
-                else:
-                    yields.append(0)
-            axes[1].bar(crops, yields)
-            axes[1].set_title('Yield')
-            axes[1].set_ylabel('Yield')
-            
-            # Districts
-            axes[2].bar(crops, df['Districts'])
-            axes[2].set_title('Number of Districts')
-            axes[2].set_ylabel('Districts')
-            
-            plt.tight_layout()
-            st.pyplot(fig)
+            if df.empty:
+                st.info("No data")
+            else:
+                # Collapsed by default so the table is only laid out when opened
+                with st.expander("Comparison Table"):
+                    _show_table(df)
+                
+                # Visualization (drawn client-side from Arrow data); one chart per
+                # metric since production, yield and district counts differ in scale
+                df = df.set_index('Crop')
+                metrics = df[['Total Production', 'Districts']].assign(
+                    Yield=df['Yield'].fillna(0)
+                )
+                for col, metric in zip(st.columns(3), ['Total Production', 'Yield', 'Districts']):
+                    with col:
+                        st.caption(metric)
+                        st.bar_chart(metrics[metric])
             
-            st.markdown(format_query_result(result))
+            st.markdown(st.session_state.comp_markdown)
         else:
             st.error(result['error'])
 
 
+def show_crop_comparison(analyzer: RainfallCropAnalyzer, available_states: tuple[str, ...], available_crops: tuple[str, ...], available_years: tuple[int, ...]) -> None:
+    st.header("⚖️ Crop Comparison")
+    
+    st.markdown("Compare two crops and get three data-backed arguments")
+    
+    _crop_comparison_section(analyzer, available_states, available_crops, available_years)
+
+
 if __name__ == "__main__":
     main()
 